@@ -11,10 +11,14 @@ class Grafo:
         self.G = None
         self.clique_maximo = []
         self.tiempo = 0.0
+        self.memoria = None
 
-    def generar(self):
-        """Genera un grafo aleatorio con n nodos y probabilidad de conexión."""
-        self.G = nx.erdos_renyi_graph(self.n_nodos, self.probabilidad)
+    def generar(self, semilla=None):
+        """
+        Genera un grafo aleatorio con n nodos y probabilidad de conexión.
+        Con la misma `semilla` se obtiene siempre el mismo grafo.
+        """
+        self.G = nx.erdos_renyi_graph(self.n_nodos, self.probabilidad, seed=semilla)
         print(f"✓ Grafo generado: {len(self.G.nodes)} nodos, {len(self.G.edges)} aristas.")
 
     def copiar_grafo(self, otro_grafo):
@@ -23,6 +27,33 @@ class Grafo:
         self.n_nodos = otro_grafo.n_nodos
         self.probabilidad = otro_grafo.probabilidad
 
+    def compactar(self, orden=None):
+        """
+        Devuelve el grafo en forma compacta: cada vértice se renumera 0..n-1
+        y su vecindad se guarda como un bitset (entero de Python).
+
+        Args:
+            orden: lista opcional con el orden de los vértices (por defecto el de G).
+                   Si no incluye todos los vértices, se compacta el subgrafo inducido.
+
+        Returns:
+            (nodos, adyacencia): nodos[i] es la etiqueta original del índice i,
+            adyacencia[i] es el bitset de vecinos del índice i
+        """
+        if self.G is None:
+            raise ValueError("Primero debe generar el grafo con .generar()")
+
+        nodos = list(orden) if orden is not None else list(self.G.nodes())
+        indice = {v: i for i, v in enumerate(nodos)}
+        adyacencia = [0] * len(nodos)
+        for u, v in self.G.edges():
+            iu, iv = indice.get(u), indice.get(v)
+            if iu is None or iv is None or iu == iv:
+                continue
+            adyacencia[iu] |= 1 << iv
+            adyacencia[iv] |= 1 << iu
+        return nodos, adyacencia
+
     # ===================================================================
     # ALGORITMO EXACTO (Bron-Kerbosch)
     # ===================================================================
@@ -58,6 +89,163 @@ class Grafo:
         print(f"📏 Tamaño: {len(self.clique_maximo)}")
         print(f"⏱️  Tiempo: {self.tiempo:.4f} segundos")
 
+    def recorrer_exacto_distribuido(self, n_workers=2, host="localhost", puerto=0):
+        """
+        Calcula el clique máximo EXACTO repartiendo la búsqueda entre un
+        coordinador y varios workers conectados por TCP (ver distribuido.py).
+
+        Con n_workers > 0 se lanzan esos workers como procesos locales; con
+        n_workers = 0 el coordinador espera workers externos en host:puerto.
+
+        NOTA: Esta función NO guarda resultados automáticamente.
+
+        Returns:
+            diccionario con las estadísticas de la ejecución distribuida
+        """
+        from distribuido import resolver_distribuido
+
+        if self.G is None:
+            raise ValueError("Primero debe generar el grafo con .generar()")
+
+        print(f"\n🌐 Buscando clique máximo con algoritmo EXACTO DISTRIBUIDO ({n_workers} workers)...")
+
+        resultado = resolver_distribuido(self, n_workers=n_workers, host=host, puerto=puerto)
+        self.clique_maximo = resultado["clique"]
+        self.tiempo = resultado["tiempo"]
+
+        print(f"\n✅ Clique máximo encontrado: {self.clique_maximo}")
+        print(f"📏 Tamaño: {len(self.clique_maximo)}")
+        print(f"⏱️  Tiempo: {self.tiempo:.4f} segundos")
+        print(f"⚙️  Utilización de workers: {resultado['utilizacion']*100:.1f}%")
+        if resultado["rss_workers_mb"] is not None:
+            print(f"🧠 Pico RSS por worker: {resultado['rss_workers_mb']:.2f} MB")
+        if resultado["caidos"]:
+            print(f"⚠️  Workers caídos: {resultado['caidos']} "
+                  f"({resultado['reencoladas']} subárboles re-encolados)")
+        return resultado
+
+    # ===================================================================
+    # CONSULTA DE DECISIÓN (¿existe un clique de tamaño ≥ k?)
+    # ===================================================================
+
+    def existe_clique(self, k):
+        """
+        Decide si el grafo tiene un clique de tamaño ≥ k, sin enumerar
+        todos los cliques como recorrer_exacto.
+
+        Returns:
+            lista con k vértices que forman un clique (testigo), o None si no existe
+        """
+        return self.existen_cliques([k])[k]
+
+    def existen_cliques(self, valores_k):
+        """
+        Responde varias consultas "¿clique de tamaño ≥ k?" compartiendo la poda.
+
+        - Los números de core se calculan UNA vez: para cada k se descartan
+          los vértices con grado < k-1 (iterado, es decir, fuera del (k-1)-core).
+        - "NO" se prueba sin buscar si el coloreo voraz del (k-1)-core usa
+          menos de k colores; si no, la búsqueda con cota de coloreo lo prueba.
+        - La búsqueda corta apenas encuentra un testigo, que se extiende de
+          forma voraz y responde los k mayores sin volver a buscar.
+        - Un "NO" para k responde "NO" para todos los k mayores.
+
+        Returns:
+            diccionario {k: testigo (lista de k vértices) o None}
+        """
+        from bisect import bisect_left
+        from bitsets import buscar_clique, colorear, extender_clique
+
+        if self.G is None:
+            raise ValueError("Primero debe generar el grafo con .generar()")
+
+        valores = sorted(set(valores_k))
+        respuestas = {}
+        if not valores:
+            return respuestas
+
+        start = time.time()
+
+        # Poda compartida: solo entran los vértices del core del menor k
+        cores = nx.core_number(self.G)
+        k_min = max(valores[0], 1)
+        orden = sorted(
+            (v for v in self.G.nodes() if cores[v] >= k_min - 1),
+            key=lambda v: cores[v],
+        )
+        nodos, adyacencia = self.compactar(orden)
+        cores_orden = [cores[v] for v in nodos]
+        todos = (1 << len(nodos)) - 1
+
+        testigo = []
+        for posicion, k in enumerate(valores):
+            if k <= len(testigo):
+                respuestas[k] = [nodos[i] for i in testigo[:k]]
+                continue
+
+            # (k-1)-core: sufijo del orden por número de core
+            primero = bisect_left(cores_orden, k - 1)
+            mascara = todos & ~((1 << primero) - 1)
+
+            hallado = None
+            if mascara and max(colorear(mascara, adyacencia)[1]) >= k:
+                hallado = buscar_clique(mascara, adyacencia, k)
+
+            if hallado is None:
+                for mayor in valores[posicion:]:
+                    respuestas[mayor] = None
+                break
+
+            testigo = extender_clique(hallado, mascara, adyacencia)
+            respuestas[k] = [nodos[i] for i in testigo[:k]]
+
+        self.tiempo = time.time() - start
+
+        print(f"\n🔎 Consulta de decisión (¿clique ≥ k?) en {self.tiempo:.4f} segundos:")
+        for k in valores:
+            if respuestas[k] is None:
+                print(f"   • k={k}: ✗ NO")
+            else:
+                print(f"   • k={k}: ✓ SÍ  testigo={respuestas[k]}")
+        return respuestas
+
+    # ===================================================================
+    # PERFIL LOCAL (mayor clique que contiene a cada vértice)
+    # ===================================================================
+
+    def recorrer_perfil_local(self, vertices=None, procesos=None):
+        """
+        Calcula, para cada vértice (o para `vertices`), el tamaño del mayor
+        clique que lo contiene, en una sola pasada compartida (ver perfil.py).
+
+        Args:
+            vertices: subconjunto de vértices a calcular (por defecto, todos)
+            procesos: procesos a usar (por defecto, uno por núcleo)
+
+        Returns:
+            diccionario {vértice: tamaño del mayor clique que lo contiene}
+        """
+        from perfil import perfil_clique_local
+
+        if self.G is None:
+            raise ValueError("Primero debe generar el grafo con .generar()")
+
+        print("\n🧭 Calculando el perfil local de cliques (mayor clique por vértice)...")
+
+        start = time.time()
+        resultado = perfil_clique_local(self, vertices, procesos)
+        self.tiempo = time.time() - start
+
+        perfil = resultado["perfil"]
+        ranking = sorted(perfil.items(), key=lambda par: par[1], reverse=True)
+
+        print(f"\n✅ Perfil calculado para {len(perfil)} vértices")
+        print(f"   • Resueltos solo con cotas (sin búsqueda): {resultado['sin_busqueda']}")
+        print(f"   • Procesos: {resultado['procesos']}")
+        print(f"🏆 Top 10: {ranking[:10]}")
+        print(f"⏱️  Tiempo: {self.tiempo:.4f} segundos")
+        return perfil
+
     # ===================================================================
     # HEURÍSTICA VORAZ
     # ===================================================================
@@ -108,7 +296,8 @@ class Grafo:
     # ===================================================================
     
     @staticmethod
-    def recorrer_exacto_multiple(duracion_maxima=3600, limpiar_anterior=False):
+    def recorrer_exacto_multiple(duracion_maxima=3600, limpiar_anterior=False, reanudar=False,
+                                 limite_memoria_mb=None):
         """
         PUNTO 3: Ejecuta el algoritmo exacto en bucle con grafos de tamaño creciente.
         Se detiene automáticamente cuando el tiempo total excede la duración máxima.
@@ -116,98 +305,96 @@ class Grafo:
         Args:
             duracion_maxima: tiempo máximo en segundos
             limpiar_anterior: si True, borra el archivo anterior antes de empezar
+            reanudar: si True, continúa desde el último checkpoint guardado
+                      (ignora duracion_maxima, limpiar_anterior y limite_memoria_mb)
+            limite_memoria_mb: si se supera en una corrida, esta se aborta y
+                               el barrido termina (None = sin límite)
         """
-        from utils import guardar_resultado, preguntar_graficar
-        import os
-        
-        archivo_salida = "resultados_exacto_multiple.txt"
-        
-        # Limpiar archivo anterior si se solicita
-        if limpiar_anterior and os.path.exists(archivo_salida):
-            os.remove(archivo_salida)
-            print(f"🗑️  Archivo anterior eliminado: {archivo_salida}")
-        
-        print("\n" + "="*60)
-        print("PUNTO 3: EXPERIMENTACIÓN - Algoritmo EXACTO")
-        print("="*60)
-        
-        n_inicial = 50
-        incremento = 50
-        prob = 0.3
-        
-        tiempo_inicio = time.time()
-        iteracion = 1
-
-        print(f"\n⚙️  Configuración:")
-        print(f"   • Tamaño inicial: {n_inicial} nodos")
-        print(f"   • Incremento: {incremento} nodos")
-        print(f"   • Probabilidad: {prob}")
-        print(f"   • Tiempo máximo: {duracion_maxima}s ({duracion_maxima/60:.1f} min)")
-        print(f"   • Archivo de salida: {archivo_salida}")
-
-        while True:
-            n_actual = n_inicial + (iteracion - 1) * incremento
-            print(f"\n--- Iteración {iteracion}: {n_actual} nodos ---")
-
-            grafo = Grafo(n_actual, prob)
-            grafo.generar()
-            grafo.recorrer_exacto()
-            
-            # Guardar resultados DESPUÉS de ejecutar
-            guardar_resultado(grafo, "exacto", archivo_salida)
-
-            tiempo_transcurrido = time.time() - tiempo_inicio
-            
-            if tiempo_transcurrido > duracion_maxima:
-                print(f"\n⏰ Tiempo máximo alcanzado ({duracion_maxima}s). Finalizando.")
-                break
-            else:
-                restante = duracion_maxima - tiempo_transcurrido
-                print(f"⏳ Tiempo acumulado: {tiempo_transcurrido:.2f}s / {duracion_maxima}s")
-                print(f"   Tiempo restante: {restante:.2f}s ({restante/60:.1f} min)")
-            
-            iteracion += 1
-
-        print(f"\n✅ Experimentación finalizada.")
-        print(f"   • Iteraciones completadas: {iteracion}")
-        print(f"   • Tiempo total: {tiempo_transcurrido:.2f}s")
-        print(f"   • Resultados guardados en: '{archivo_salida}'")
-        
-        # Preguntar si quiere graficar
-        preguntar_graficar(
-            mensaje="¿Quieres graficar resultados del algoritmo EXACTO (Punto 4)?",
-            funcion_graficar=lambda: __import__('utils').graficar_resultados(archivo_salida)
+        Grafo._recorrer_barrido(
+            titulo="PUNTO 3: EXPERIMENTACIÓN - Algoritmo EXACTO",
+            metodo="exacto",
+            n_inicial=50,
+            incremento=50,
+            archivo_salida="resultados_exacto_multiple.txt",
+            archivo_checkpoint="checkpoint_exacto_multiple.json",
+            mensaje_graficar="¿Quieres graficar resultados del algoritmo EXACTO (Punto 4)?",
+            duracion_maxima=duracion_maxima,
+            limpiar_anterior=limpiar_anterior,
+            reanudar=reanudar,
+            limite_memoria_mb=limite_memoria_mb,
         )
 
     @staticmethod
-    def recorrer_heuristico_multiple(duracion_maxima=1200, limpiar_anterior=False):
+    def recorrer_heuristico_multiple(duracion_maxima=1200, limpiar_anterior=False, reanudar=False,
+                                     limite_memoria_mb=None):
         """
         PUNTO 7: Ejecuta el heurístico en bucle con grafos grandes (n >= 1000).
         
         Args:
             duracion_maxima: tiempo máximo en segundos
             limpiar_anterior: si True, borra el archivo anterior antes de empezar
+            reanudar: si True, continúa desde el último checkpoint guardado
+                      (ignora duracion_maxima, limpiar_anterior y limite_memoria_mb)
+            limite_memoria_mb: si se supera en una corrida, esta se aborta y
+                               el barrido termina (None = sin límite)
         """
-        from utils import guardar_resultado, preguntar_graficar
+        Grafo._recorrer_barrido(
+            titulo="PUNTO 7: ESCALABILIDAD - Algoritmo HEURÍSTICO",
+            metodo="heuristico",
+            n_inicial=1000,
+            incremento=500,
+            archivo_salida="resultados_heuristico_multiple.txt",
+            archivo_checkpoint="checkpoint_heuristico_multiple.json",
+            mensaje_graficar="¿Quieres graficar resultados de ESCALABILIDAD del heurístico (Punto 7)?",
+            duracion_maxima=duracion_maxima,
+            limpiar_anterior=limpiar_anterior,
+            reanudar=reanudar,
+            limite_memoria_mb=limite_memoria_mb,
+        )
+
+    @staticmethod
+    def _recorrer_barrido(titulo, metodo, n_inicial, incremento, archivo_salida, archivo_checkpoint,
+                          mensaje_graficar, duracion_maxima, limpiar_anterior, reanudar,
+                          limite_memoria_mb, prob=0.3):
+        """
+        Bucle común de los Puntos 3 y 7: resuelve grafos de n_inicial,
+        n_inicial + incremento, ... nodos con recorrer_<metodo>() hasta
+        agotar duracion_maxima.
+        
+        Tras cada instancia se guarda un checkpoint atómico con la iteración,
+        el tiempo consumido y la semilla, así una caída o Ctrl-C no obliga a
+        empezar de nuevo.
+        """
+        from utils import (guardar_resultado, preguntar_graficar, nuevo_estado_barrido,
+                           cargar_checkpoint, guardar_checkpoint, borrar_checkpoint,
+                           restaurar_resultados)
+        from memoria import medir_corrida
         import os
         
-        archivo_salida = "resultados_heuristico_multiple.txt"
+        estado = cargar_checkpoint(archivo_checkpoint) if reanudar else None
+        if reanudar and estado is None:
+            print("\n⚠️  No hay un experimento para reanudar. Se empieza de cero.")
         
-        # Limpiar archivo anterior si se solicita
-        if limpiar_anterior and os.path.exists(archivo_salida):
-            os.remove(archivo_salida)
-            print(f"🗑️  Archivo anterior eliminado: {archivo_salida}")
+        if estado is None:
+            # Limpiar archivo anterior si se solicita
+            if limpiar_anterior and os.path.exists(archivo_salida):
+                os.remove(archivo_salida)
+                print(f"🗑️  Archivo anterior eliminado: {archivo_salida}")
+            estado = nuevo_estado_barrido(duracion_maxima, archivo_salida, limite_memoria_mb)
+        else:
+            duracion_maxima = estado["duracion_maxima"]
+            limite_memoria_mb = estado.get("limite_memoria_mb")
+            # Descarta lo escrito después del último checkpoint (instancia a medias)
+            restaurar_resultados(archivo_salida, estado["bytes_resultados"])
         
         print("\n" + "="*60)
-        print("PUNTO 7: ESCALABILIDAD - Algoritmo HEURÍSTICO")
+        print(titulo)
         print("="*60)
         
-        n_inicial = 1000
-        incremento = 500
-        prob = 0.3
-        
-        tiempo_inicio = time.time()
-        iteracion = 1
+        # El tiempo ya consumido antes de la interrupción cuenta para el límite
+        tiempo_inicio = time.time() - estado["tiempo_transcurrido"]
+        iteracion = estado["iteracion"]
+        tiempo_transcurrido = estado["tiempo_transcurrido"]
 
         print(f"\n⚙️  Configuración:")
         print(f"   • Tamaño inicial: {n_inicial} nodos")
@@ -215,51 +402,80 @@ class Grafo:
         print(f"   • Probabilidad: {prob}")
         print(f"   • Tiempo máximo: {duracion_maxima}s ({duracion_maxima/60:.1f} min)")
         print(f"   • Archivo de salida: {archivo_salida}")
+        print(f"   • Checkpoint: {archivo_checkpoint}")
+        if limite_memoria_mb is not None:
+            print(f"   • Límite de memoria: {limite_memoria_mb} MB")
+        if estado["completados"]:
+            print(f"\n▶️  Reanudando en la iteración {iteracion} "
+                  f"(ya completados: {estado['completados']})")
 
-        while True:
-            n_actual = n_inicial + (iteracion - 1) * incremento
-            print(f"\n--- Iteración {iteracion}: {n_actual} nodos ---")
+        guardar_checkpoint(archivo_checkpoint, estado)
 
-            grafo = Grafo(n_actual, prob)
-            grafo.generar()
-            grafo.recorrer_heuristico()
-            
-            # Guardar resultados DESPUÉS de ejecutar
-            guardar_resultado(grafo, "heuristico", archivo_salida)
+        try:
+            while tiempo_transcurrido <= duracion_maxima:
+                n_actual = n_inicial + (iteracion - 1) * incremento
+                print(f"\n--- Iteración {iteracion}: {n_actual} nodos ---")
 
-            tiempo_transcurrido = time.time() - tiempo_inicio
-            
-            if tiempo_transcurrido > duracion_maxima:
-                print(f"\n⏰ Tiempo máximo alcanzado ({duracion_maxima}s). Finalizando.")
-                break
-            else:
-                restante = duracion_maxima - tiempo_transcurrido
-                print(f"⏳ Tiempo acumulado: {tiempo_transcurrido:.2f}s / {duracion_maxima}s")
-                print(f"   Tiempo restante: {restante:.2f}s ({restante/60:.1f} min)")
-            
-            iteracion += 1
+                grafo = Grafo(n_actual, prob)
+                grafo.memoria = medir_corrida(
+                    generar=lambda: grafo.generar(semilla=estado["semilla"] + iteracion),
+                    resolver=getattr(grafo, f"recorrer_{metodo}"),
+                    limite_mb=limite_memoria_mb,
+                )
+                if grafo.memoria is None:
+                    print(f"   Finalizando en {n_actual} nodos.")
+                    break
+                
+                # Guardar resultados DESPUÉS de ejecutar
+                guardar_resultado(grafo, metodo, archivo_salida)
+
+                tiempo_transcurrido = time.time() - tiempo_inicio
+
+                # Checkpoint: la instancia ya quedó escrita en el archivo de salida
+                estado["completados"].append(n_actual)
+                estado["iteracion"] = iteracion + 1
+                estado["tiempo_transcurrido"] = tiempo_transcurrido
+                estado["bytes_resultados"] = os.path.getsize(archivo_salida)
+                guardar_checkpoint(archivo_checkpoint, estado)
+                
+                if tiempo_transcurrido > duracion_maxima:
+                    print(f"\n⏰ Tiempo máximo alcanzado ({duracion_maxima}s). Finalizando.")
+                else:
+                    restante = duracion_maxima - tiempo_transcurrido
+                    print(f"⏳ Tiempo acumulado: {tiempo_transcurrido:.2f}s / {duracion_maxima}s")
+                    print(f"   Tiempo restante: {restante:.2f}s ({restante/60:.1f} min)")
+                    iteracion += 1
+        except KeyboardInterrupt:
+            print(f"\n\n⏸️  Experimento interrumpido. Progreso guardado en '{archivo_checkpoint}'.")
+            print("   Para continuar: python main.py --resume")
+            return
+
+        borrar_checkpoint(archivo_checkpoint)
 
         print(f"\n✅ Experimentación finalizada.")
-        print(f"   • Iteraciones completadas: {iteracion}")
+        print(f"   • Iteraciones completadas: {len(estado['completados'])}")
         print(f"   • Tiempo total: {tiempo_transcurrido:.2f}s")
         print(f"   • Resultados guardados en: '{archivo_salida}'")
         
         # Preguntar si quiere graficar
         preguntar_graficar(
-            mensaje="¿Quieres graficar resultados de ESCALABILIDAD del heurístico (Punto 7)?",
+            mensaje=mensaje_graficar,
             funcion_graficar=lambda: __import__('utils').graficar_resultados(archivo_salida)
         )
 
     @staticmethod
-    def recorrer_comparacion(limpiar_anterior=False):
+    def recorrer_comparacion(limpiar_anterior=False, limite_memoria_mb=None):
         """
         PUNTO 6: Ejecuta AMBOS algoritmos sobre los MISMOS grafos.
         Usa tamaños fijos: 200, 600, 1000, 1500 nodos con probabilidad 0.3
         
         Args:
             limpiar_anterior: si True, borra el archivo anterior antes de empezar
+            limite_memoria_mb: si se supera en una corrida, la comparación
+                               se detiene (None = sin límite)
         """
-        from utils import guardar_comparacion, preguntar_graficar
+        from utils import guardar_comparacion, preguntar_graficar, mostrar_memoria
+        from memoria import medir_corrida
         import os
         
         archivo_salida = "comparacion_metodos.txt"
@@ -292,6 +508,7 @@ class Grafo:
                 f.write(f"Probabilidad: {prob}\n")
                 f.write("="*70 + "\n\n")
         
+        casos_completados = 0
         for idx, n in enumerate(tamaños, 1):
             print(f"\n{'='*60}")
             print(f"Caso {idx}/{len(tamaños)}: {n} nodos")
@@ -300,22 +517,36 @@ class Grafo:
             # 1. Generar el grafo UNA SOLA VEZ
             print(f"\n📊 Generando grafo de {n} nodos...")
             grafo_base = Grafo(n, prob)
-            grafo_base.generar()
+            memoria_base = medir_corrida(generar=grafo_base.generar, limite_mb=limite_memoria_mb,
+                                         mostrar=False)
+            if memoria_base is None:
+                break
             
             # 2. EJECUTAR ALGORITMO EXACTO
             print("\n🔴 Ejecutando algoritmo EXACTO...")
             grafo_exacto = Grafo(n, prob)
             grafo_exacto.copiar_grafo(grafo_base)
-            grafo_exacto.recorrer_exacto()
-            
-            tamaño_exacto = len(grafo_exacto.clique_maximo)
-            tiempo_exacto = grafo_exacto.tiempo
+            grafo_exacto.memoria = medir_corrida(resolver=grafo_exacto.recorrer_exacto,
+                                                 limite_mb=limite_memoria_mb, mostrar=False)
+            if grafo_exacto.memoria is None:
+                break
             
             # 3. EJECUTAR HEURÍSTICA
             print("\n🟢 Ejecutando HEURÍSTICA...")
             grafo_heuristico = Grafo(n, prob)
             grafo_heuristico.copiar_grafo(grafo_base)
-            grafo_heuristico.recorrer_heuristico()
+            grafo_heuristico.memoria = medir_corrida(resolver=grafo_heuristico.recorrer_heuristico,
+                                                     limite_mb=limite_memoria_mb, mostrar=False)
+            if grafo_heuristico.memoria is None:
+                break
+            
+            # El grafo se generó una sola vez para ambos
+            for memoria in (grafo_exacto.memoria, grafo_heuristico.memoria):
+                memoria["generacion_rss_mb"] = memoria_base["generacion_rss_mb"]
+                memoria["generacion_mb"] = memoria_base["generacion_mb"]
+            
+            tamaño_exacto = len(grafo_exacto.clique_maximo)
+            tiempo_exacto = grafo_exacto.tiempo
             
             tamaño_heuristico = len(grafo_heuristico.clique_maximo)
             tiempo_heuristico = grafo_heuristico.tiempo
@@ -337,12 +568,14 @@ class Grafo:
                 'exacto': {
                     'tamaño': tamaño_exacto,
                     'tiempo': tiempo_exacto,
-                    'clique': grafo_exacto.clique_maximo
+                    'clique': grafo_exacto.clique_maximo,
+                    'memoria': grafo_exacto.memoria
                 },
                 'heuristico': {
                     'tamaño': tamaño_heuristico,
                     'tiempo': tiempo_heuristico,
-                    'clique': grafo_heuristico.clique_maximo
+                    'clique': grafo_heuristico.clique_maximo,
+                    'memoria': grafo_heuristico.memoria
                 },
                 'alcanzó_optimo': alcanzó_optimo,
                 'error_relativo': error_relativo,
@@ -350,6 +583,7 @@ class Grafo:
             }
             
             guardar_comparacion(resultado, archivo_salida)
+            casos_completados += 1
             
             # 6. MOSTRAR RESUMEN
             print(f"\n{'─'*60}")
@@ -362,13 +596,107 @@ class Grafo:
             print(f"   Error: {error_relativo:.2f}%")
             print(f"   Speedup: {speedup:.2f}x más rápido")
             print(f"{'─'*60}")
+            print("   🔴 Exacto:     ", end="")
+            mostrar_memoria(grafo_exacto.memoria)
+            print("   🟢 Heurístico: ", end="")
+            mostrar_memoria(grafo_heuristico.memoria)
         
         print(f"\n✅ Comparación completada.")
-        print(f"   • Casos analizados: {len(tamaños)}")
+        print(f"   • Casos analizados: {casos_completados}/{len(tamaños)}")
         print(f"   • Resultados guardados en: '{archivo_salida}'")
         
         # Preguntar si quiere graficar
         preguntar_graficar(
             mensaje="¿Quieres graficar la COMPARACIÓN (Punto 6)?",
             funcion_graficar=lambda: __import__('utils').graficar_comparacion(archivo_salida)
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def recorrer_decision_benchmark(n=300, prob=0.3, valores_k=None, limpiar_anterior=False,
+                                    limite_memoria_mb=None):
+        """
+        Mide la latencia de la consulta de decisión contra una optimización
+        completa (recorrer_exacto) sobre el MISMO grafo.
+
+        Args:
+            n, prob: tamaño y probabilidad del grafo
+            valores_k: umbrales a consultar (por defecto ω-2 .. ω+1)
+            limpiar_anterior: si True, borra el archivo anterior antes de empezar
+            limite_memoria_mb: si se supera, el benchmark se aborta (None = sin límite)
+        """
+        from utils import guardar_benchmark_decision
+        from memoria import medir_corrida
+        import os
+
+        archivo_salida = "benchmark_decision.txt"
+
+        # Limpiar archivo anterior si se solicita
+        if limpiar_anterior and os.path.exists(archivo_salida):
+            os.remove(archivo_salida)
+            print(f"🗑️  Archivo anterior eliminado: {archivo_salida}")
+
+        print("\n" + "="*60)
+        print("BENCHMARK: Consulta de decisión vs Optimización completa")
+        print("="*60)
+
+        grafo_base = Grafo(n, prob)
+        memoria_base = medir_corrida(generar=grafo_base.generar, limite_mb=limite_memoria_mb,
+                                     mostrar=False)
+        if memoria_base is None:
+            return
+
+        # 1. OPTIMIZACIÓN COMPLETA
+        grafo_exacto = Grafo(n, prob)
+        grafo_exacto.copiar_grafo(grafo_base)
+        grafo_exacto.memoria = medir_corrida(resolver=grafo_exacto.recorrer_exacto,
+                                             limite_mb=limite_memoria_mb)
+        if grafo_exacto.memoria is None:
+            return
+        omega = len(grafo_exacto.clique_maximo)
+
+        if valores_k is None:
+            valores_k = [k for k in range(omega - 2, omega + 2) if k > 0]
+
+        # 2. CONSULTAS INDIVIDUALES
+        grafo_decision = Grafo(n, prob)
+        grafo_decision.copiar_grafo(grafo_base)
+        individuales = {}
+        def consultar_individuales():
+            for k in valores_k:
+                testigo = grafo_decision.existe_clique(k)
+                individuales[k] = (testigo is not None, grafo_decision.tiempo)
+        memoria_individuales = medir_corrida(resolver=consultar_individuales,
+                                             limite_mb=limite_memoria_mb)
+        if memoria_individuales is None:
+            return
+
+        # 3. CONSULTA EN LOTE (poda compartida)
+        grafo_decision.memoria = medir_corrida(resolver=lambda: grafo_decision.existen_cliques(valores_k),
+                                               limite_mb=limite_memoria_mb)
+        if grafo_decision.memoria is None:
+            return
+        tiempo_lote = grafo_decision.tiempo
+
+        resultado = {
+            'n': n,
+            'probabilidad': prob,
+            'aristas': len(grafo_base.G.edges),
+            'omega': omega,
+            'tiempo_exacto': grafo_exacto.tiempo,
+            'individuales': individuales,
+            'tiempo_lote': tiempo_lote,
+            'memoria_exacto': grafo_exacto.memoria,
+            'memoria_individuales': memoria_individuales,
+            'memoria_lote': grafo_decision.memoria,
+        }
+        guardar_benchmark_decision(resultado, archivo_salida)
+
+        print(f"\n{'─'*60}")
+        print(f"📊 LATENCIA (ω = {omega}, exacto = {grafo_exacto.tiempo:.4f}s)")
+        print(f"{'─'*60}")
+        for k, (existe, tiempo) in individuales.items():
+            speedup = grafo_exacto.tiempo / tiempo if tiempo > 0 else float('inf')
+            print(f"   k={k:2d}: {'SÍ' if existe else 'NO'}  {tiempo:8.4f}s  ({speedup:.1f}x)")
+        print(f"   Lote {valores_k}: {tiempo_lote:.4f}s")
+        print(f"{'─'*60}")
+        print(f"   • Resultados guardados en: '{archivo_salida}'")
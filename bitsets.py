@@ -0,0 +1,138 @@
+"""
+Utilidades sobre grafos compactos: cada vértice es un índice 0..n-1 y su
+vecindad un bitset (entero de Python), como los que devuelve Grafo.compactar().
+"""
+
+
+def contar(bitset):
+    """Cantidad de vértices en el bitset."""
+    return bin(bitset).count("1")
+
+
+def indices(bitset):
+    """Genera los índices de los vértices del bitset, de menor a mayor."""
+    while bitset:
+        bit = bitset & -bitset
+        yield bit.bit_length() - 1
+        bitset ^= bit
+
+
+def colorear(candidatos, adyacencia):
+    """
+    Coloreo voraz de los candidatos (cota de Tomita).
+    Devuelve los vértices ordenados por color y el color de cada uno.
+    """
+    orden = []
+    colores = []
+    color = 0
+    sin_color = candidatos
+    while sin_color:
+        color += 1
+        disponibles = sin_color
+        while disponibles:
+            bit = disponibles & -disponibles
+            v = bit.bit_length() - 1
+            disponibles &= ~bit & ~adyacencia[v]
+            sin_color &= ~bit
+            orden.append(v)
+            colores.append(color)
+    return orden, colores
+
+
+def expandir(clique, candidatos, adyacencia, mejor):
+    """
+    Genera los hijos de un nodo (clique, candidatos) que todavía pueden
+    superar a `mejor`. Cada hijo es (clique, candidatos, cota).
+    El primer hijo devuelto es el de mayor color (el más prometedor).
+    """
+    hijos = []
+    orden, colores = colorear(candidatos, adyacencia)
+    for i in range(len(orden) - 1, -1, -1):
+        cota = len(clique) + colores[i]
+        if cota <= mejor:
+            break
+        v = orden[i]
+        hijos.append((clique + (v,), candidatos & adyacencia[v], cota))
+        candidatos &= ~(1 << v)
+    return hijos
+
+
+def numeros_core(adyacencia):
+    """Número de core de cada vértice del subgrafo (pelado por grado mínimo)."""
+    grado = [contar(a) for a in adyacencia]
+    restantes = set(range(len(adyacencia)))
+    mascara = (1 << len(adyacencia)) - 1
+    core = [0] * len(adyacencia)
+    k = 0
+    while restantes:
+        v = min(restantes, key=grado.__getitem__)
+        k = max(k, grado[v])
+        core[v] = k
+        restantes.discard(v)
+        mascara &= ~(1 << v)
+        vecinos = adyacencia[v] & mascara
+        while vecinos:
+            bit = vecinos & -vecinos
+            grado[bit.bit_length() - 1] -= 1
+            vecinos ^= bit
+    return core
+
+
+def buscar_clique(candidatos, adyacencia, k, clique=()):
+    """
+    Busca un clique de k vértices que extienda a `clique` usando solo
+    `candidatos`. Corta apenas encuentra uno (consulta de decisión).
+
+    Returns:
+        tupla con los índices del clique, o None si no existe
+    """
+    if len(clique) >= k:
+        return clique
+    orden, colores = colorear(candidatos, adyacencia)
+    for i in range(len(orden) - 1, -1, -1):
+        # El coloreo prueba que no quedan k vértices mutuamente adyacentes
+        if len(clique) + colores[i] < k:
+            return None
+        v = orden[i]
+        hallado = buscar_clique(candidatos & adyacencia[v], adyacencia, k, clique + (v,))
+        if hallado is not None:
+            return hallado
+        candidatos &= ~(1 << v)
+    return None
+
+
+def extender_clique(clique, candidatos, adyacencia):
+    """Agrega de forma voraz vecinos comunes a `clique` (el de más vecinos primero)."""
+    clique = list(clique)
+    comunes = candidatos
+    for v in clique:
+        comunes &= adyacencia[v]
+    while comunes:
+        v = max(indices(comunes), key=lambda u: contar(adyacencia[u] & comunes))
+        clique.append(v)
+        comunes &= adyacencia[v]
+    return clique
+
+
+def clique_maximo(candidatos, adyacencia, mejor=0, clique=()):
+    """
+    Ramificación y poda con cota de coloreo: busca el mayor clique que
+    extiende a `clique` con vértices de `candidatos`, pero solo si supera
+    `mejor` vértices en total.
+
+    Returns:
+        tupla con los índices del clique, o None si ninguno supera `mejor`
+    """
+    hallado = clique if len(clique) > mejor else None
+    if hallado is not None:
+        mejor = len(clique)
+    orden, colores = colorear(candidatos, adyacencia)
+    for i in range(len(orden) - 1, -1, -1):
+        if len(clique) + colores[i] <= mejor:
+            break
+        v = orden[i]
+        sub = clique_maximo(candidatos & adyacencia[v], adyacencia, mejor, clique + (v,))
+        if sub is not None:
+            hallado, mejor = sub, len(sub)
+        candidatos &= ~(1 << v)
+    return hallado
@@ -0,0 +1,490 @@
+"""
+Búsqueda EXACTA del clique máximo distribuida en modo coordinador/workers.
+
+El coordinador envía el grafo compacto (bitsets) UNA sola vez a cada worker,
+reparte subárboles de la búsqueda bajo demanda, roba trabajo a los workers
+ocupados cuando la cola se vacía, difunde cada mejora del incumbente a todos
+y re-encola los subárboles de un worker que se cae.
+
+La comunicación es por TCP (multiprocessing.connection), así que se puede
+probar con varios procesos en localhost o lanzar workers en otras máquinas:
+
+    python distribuido.py worker HOST PUERTO
+"""
+import collections
+import ipaddress
+import multiprocessing
+import os
+import queue
+import socket
+import sys
+import threading
+import time
+from multiprocessing.connection import Client, Listener, wait
+
+import networkx as nx
+
+from bitsets import expandir
+from memoria import pico_rss_mb
+
+
+# Clave pública: solo se acepta en direcciones de loopback, porque los
+# mensajes se deserializan con pickle (quien conozca la clave ejecuta código)
+CLAVE_LOCAL = b"clique"
+CLAVE_POR_DEFECTO = os.environ.get("CLIQUE_AUTHKEY", "").encode() or CLAVE_LOCAL
+
+# Cada cuántos nodos explorados revisa el worker si llegaron mensajes
+NODOS_ENTRE_CONSULTAS = 256
+
+# Segundos mínimos entre dos pedidos de donación al mismo worker
+PAUSA_ENTRE_ROBOS = 0.05
+
+
+# ===================================================================
+# AUTENTICACIÓN
+# ===================================================================
+
+def es_loopback(host):
+    """True si todas las direcciones a las que resuelve `host` son de loopback."""
+    try:
+        direcciones = {info[4][0] for info in socket.getaddrinfo(host, None)}
+    except (socket.gaierror, UnicodeError):
+        return False
+    return bool(direcciones) and all(
+        ipaddress.ip_address(d.split("%")[0]).is_loopback for d in direcciones
+    )
+
+
+def validar_clave(host, clave):
+    """
+    Rechaza escuchar en (o conectarse a) una dirección que no es de loopback
+    con la clave pública por defecto.
+
+    Raises:
+        ValueError: si `host` no es local y no se definió CLIQUE_AUTHKEY
+    """
+    if clave == CLAVE_LOCAL and not es_loopback(host):
+        raise ValueError(
+            f"'{host}' no es una dirección local: defina una clave compartida en la "
+            "variable de entorno CLIQUE_AUTHKEY (la clave por defecto es pública)"
+        )
+
+
+# ===================================================================
+# SUBÁRBOLES
+# ===================================================================
+
+def subarboles_iniciales(adyacencia):
+    """
+    Divide la búsqueda en un subárbol por vértice: el vértice i se combina
+    solo con sus vecinos de índice mayor, así cada clique se cuenta una vez.
+    """
+    tareas = []
+    for i, vecinos in enumerate(adyacencia):
+        candidatos = vecinos >> (i + 1) << (i + 1)
+        tareas.append(((i,), candidatos, 1 + bin(candidatos).count("1")))
+    return tareas
+
+
+# ===================================================================
+# WORKER
+# ===================================================================
+
+class _Worker:
+    """Estado de un worker: grafo compacto, pila local de nodos e incumbente."""
+
+    def __init__(self, conexion, fallar_tras_nodos=None):
+        self.conexion = conexion
+        self.adyacencia = []
+        self.mejor = 0
+        self.pila = collections.deque()
+        self.nodos = 0
+        self.fallar_tras_nodos = fallar_tras_nodos
+
+    def atender(self, mensaje):
+        """Procesa un mensaje del coordinador. Devuelve False si hay que terminar."""
+        tipo = mensaje[0]
+        if tipo == "cota":
+            self.mejor = max(self.mejor, mensaje[1])
+        elif tipo == "robar":
+            # Se donan los nodos más antiguos (los de más arriba en el árbol)
+            donados = [self.pila.popleft() for _ in range(len(self.pila) // 2)]
+            self.conexion.send(("donar", donados))
+        elif tipo == "fin":
+            return False
+        return True
+
+    def consultar(self):
+        """Atiende los mensajes pendientes sin bloquear."""
+        while self.conexion.poll():
+            if not self.atender(self.conexion.recv()):
+                return False
+        return True
+
+    def resolver(self, tarea_id, clique, candidatos, cota):
+        """Explora el subárbol asignado en profundidad usando la pila local."""
+        inicio = time.time()
+        self.pila.append((clique, candidatos, cota))
+        while self.pila:
+            clique, candidatos, cota = self.pila.pop()
+            if cota <= self.mejor:
+                continue
+            self.nodos += 1
+            if self.fallar_tras_nodos is not None and self.nodos >= self.fallar_tras_nodos:
+                os._exit(1)
+
+            if len(clique) > self.mejor:
+                self.mejor = len(clique)
+                self.conexion.send(("mejora", list(clique)))
+            if candidatos:
+                # Se apilan al revés para explorar primero el hijo más prometedor
+                self.pila.extend(reversed(expandir(clique, candidatos, self.adyacencia, self.mejor)))
+
+            if self.nodos % NODOS_ENTRE_CONSULTAS == 0 and not self.consultar():
+                return False
+        self.conexion.send(("hecho", tarea_id, self.nodos, time.time() - inicio, pico_rss_mb()))
+        return True
+
+    def ejecutar(self):
+        mensaje = self.conexion.recv()
+        _, self.adyacencia, self.mejor = mensaje
+        # "hecho" ya implica pedir otra tarea: un solo mensaje por vuelta
+        self.conexion.send(("pedir",))
+        while True:
+            while True:
+                mensaje = self.conexion.recv()
+                if mensaje[0] == "tarea":
+                    break
+                if not self.atender(mensaje):
+                    return
+            _, tarea_id, clique, candidatos, cota = mensaje
+            if not self.resolver(tarea_id, clique, candidatos, cota):
+                return
+
+
+def ejecutar_worker(host, puerto, clave=CLAVE_POR_DEFECTO, fallar_tras_nodos=None):
+    """
+    Conecta un worker al coordinador y trabaja hasta recibir "fin".
+
+    Args:
+        host, puerto: dirección TCP del coordinador
+        clave: clave de autenticación compartida con el coordinador
+        fallar_tras_nodos: si se indica, el proceso muere tras explorar esa
+                           cantidad de nodos (para probar la tolerancia a fallos)
+    """
+    validar_clave(host, clave)
+    conexion = Client((host, puerto), authkey=clave)
+    try:
+        _Worker(conexion, fallar_tras_nodos).ejecutar()
+    except (EOFError, ConnectionError):
+        pass
+    finally:
+        conexion.close()
+
+
+# ===================================================================
+# COORDINADOR
+# ===================================================================
+
+class Coordinador:
+    """
+    Reparte los subárboles de la búsqueda exacta entre los workers conectados.
+
+    Args:
+        adyacencia: grafo compacto (lista de bitsets)
+        clique_inicial: incumbente inicial (p. ej. el de la heurística voraz)
+        host, puerto: dirección donde escuchar (puerto 0 = elegir uno libre)
+        clave: clave de autenticación compartida con los workers
+    """
+
+    def __init__(self, adyacencia, clique_inicial=None, host="localhost", puerto=0,
+                 clave=CLAVE_POR_DEFECTO):
+        self.adyacencia = adyacencia
+        self.mejor = list(clique_inicial or [])
+        validar_clave(host, clave)
+        self.listener = Listener((host, puerto), authkey=clave)
+        self.direccion = self.listener.address
+
+        self.cola = collections.deque()
+        self.siguiente_id = 0
+        for tarea in subarboles_iniciales(adyacencia):
+            self._encolar(tarea)
+
+        self.workers = {}         # conexión -> {id_tarea: tarea}
+        self.ociosos = set()      # conexiones esperando trabajo
+        self.robos = set()        # conexiones a las que se pidió donar
+        self.ultimo_robo = {}     # conexión -> momento del último pedido de donación
+        self.nodos = {}           # conexión -> nodos explorados
+        self.ocupado = {}         # conexión -> segundos trabajando
+        self.rss = {}             # conexión -> pico de RSS informado (MB)
+        self.caidos = 0
+        self.reencoladas = 0
+
+        self._nuevas = queue.Queue()
+        self._aceptador = threading.Thread(target=self._aceptar, daemon=True)
+
+    def _encolar(self, tarea):
+        self.cola.append((self.siguiente_id,) + tuple(tarea))
+        self.siguiente_id += 1
+
+    def _aceptar(self):
+        while True:
+            try:
+                self._nuevas.put(self.listener.accept())
+            except OSError:
+                return
+            except Exception:
+                # Autenticación fallida u otro error de un cliente: se ignora
+                continue
+
+    def _registrar(self, conexion):
+        conexion.send(("grafo", self.adyacencia, len(self.mejor)))
+        self.workers[conexion] = {}
+        self.nodos[conexion] = 0
+        self.ocupado[conexion] = 0.0
+
+    def _baja(self, conexion):
+        """Un worker se cayó: sus subárboles vuelven a la cola."""
+        pendientes = self.workers.pop(conexion, {})
+        for tarea_id, tarea in pendientes.items():
+            self.cola.appendleft((tarea_id,) + tarea)
+        self.reencoladas += len(pendientes)
+        self.ociosos.discard(conexion)
+        self.robos.discard(conexion)
+        self.caidos += 1
+        conexion.close()
+        print(f"   ⚠️  Worker caído: {len(pendientes)} subárbol(es) re-encolado(s)")
+
+    def _difundir(self, mensaje):
+        for conexion in list(self.workers):
+            try:
+                conexion.send(mensaje)
+            except OSError:
+                self._baja(conexion)
+
+    def _atender(self, conexion, mensaje):
+        tipo = mensaje[0]
+        if tipo == "pedir":
+            self.ociosos.add(conexion)
+        elif tipo == "mejora":
+            if len(mensaje[1]) > len(self.mejor):
+                self.mejor = mensaje[1]
+                self._difundir(("cota", len(self.mejor)))
+        elif tipo == "hecho":
+            _, tarea_id, nodos, segundos, rss = mensaje
+            self.workers[conexion].pop(tarea_id, None)
+            self.nodos[conexion] = nodos
+            self.ocupado[conexion] += segundos
+            if rss is not None:
+                self.rss[conexion] = rss
+            self.ociosos.add(conexion)
+        elif tipo == "donar":
+            self.robos.discard(conexion)
+            for tarea in mensaje[1]:
+                self._encolar(tarea)
+
+    def _repartir(self):
+        for conexion in list(self.ociosos):
+            while self.cola:
+                tarea_id, clique, candidatos, cota = self.cola.popleft()
+                if cota > len(self.mejor):
+                    break
+            else:
+                break
+            self.ociosos.discard(conexion)
+            self.workers[conexion][tarea_id] = (clique, candidatos, cota)
+            conexion.send(("tarea", tarea_id, clique, candidatos, cota))
+
+        # Cola vacía y workers ociosos: se roba trabajo a los ocupados
+        if not self.cola and self.ociosos:
+            ahora = time.time()
+            for conexion, tareas in self.workers.items():
+                if not tareas or conexion in self.ociosos or conexion in self.robos:
+                    continue
+                # Sin esperar entre pedidos, un worker sin nada que donar
+                # recibiría "robar" en cada vuelta del bucle
+                if ahora - self.ultimo_robo.get(conexion, 0.0) < PAUSA_ENTRE_ROBOS:
+                    continue
+                conexion.send(("robar",))
+                self.robos.add(conexion)
+                self.ultimo_robo[conexion] = ahora
+
+    def _terminado(self):
+        return not self.cola and not any(self.workers.values()) and not self.robos
+
+    def _todos_muertos(self, procesos):
+        return procesos and not any(p.is_alive() for p in procesos)
+
+    def resolver(self, procesos=(), esperar_workers=1):
+        """
+        Ejecuta la búsqueda hasta agotar todos los subárboles.
+
+        Args:
+            procesos: procesos locales lanzados como workers (para detectar
+                      que murieron todos y no quedarse esperando)
+            esperar_workers: workers a esperar antes de empezar a repartir
+                             (así el tiempo medido no incluye el arranque)
+
+        Returns:
+            diccionario con el clique (en índices compactos) y estadísticas
+        """
+        self._aceptador.start()
+        try:
+            while len(self.workers) < esperar_workers:
+                try:
+                    self._registrar(self._nuevas.get(timeout=0.5))
+                except queue.Empty:
+                    if self._todos_muertos(procesos):
+                        raise RuntimeError("Los workers terminaron antes de conectarse")
+            inicio = time.time()
+
+            while True:
+                while not self._nuevas.empty():
+                    self._registrar(self._nuevas.get())
+
+                for conexion in wait(list(self.workers), timeout=0.1):
+                    try:
+                        mensaje = conexion.recv()
+                    except (EOFError, OSError):
+                        self._baja(conexion)
+                        continue
+                    self._atender(conexion, mensaje)
+
+                try:
+                    self._repartir()
+                except OSError:
+                    pass
+                if self.workers and self._terminado():
+                    break
+                if not self.workers and self._nuevas.empty() and self._todos_muertos(procesos):
+                    raise RuntimeError("Todos los workers terminaron antes de completar la búsqueda")
+        finally:
+            self._difundir(("fin",))
+            for conexion in list(self.workers):
+                conexion.close()
+            self.listener.close()
+
+        tiempo = time.time() - inicio
+        ocupado = sum(self.ocupado.values())
+        n_workers = max(len(self.ocupado), 1)
+        return {
+            "clique": self.mejor,
+            "tiempo": tiempo,
+            "workers": len(self.ocupado),
+            "nodos": sum(self.nodos.values()),
+            "utilizacion": ocupado / (n_workers * tiempo) if tiempo > 0 else 0.0,
+            "caidos": self.caidos,
+            "reencoladas": self.reencoladas,
+            "rss_workers_mb": max(self.rss.values(), default=None),
+        }
+
+
+# ===================================================================
+# PUNTO DE ENTRADA DE ALTO NIVEL
+# ===================================================================
+
+def orden_degeneracion(G):
+    """Ordena los vértices por número de core y grado (los más densos al final)."""
+    cores = nx.core_number(G)
+    return sorted(G.nodes(), key=lambda v: (cores[v], G.degree[v]))
+
+
+def clique_voraz(G):
+    """Incumbente inicial: la misma estrategia voraz de recorrer_heuristico."""
+    clique = []
+    for v in sorted(G.nodes(), key=lambda n: G.degree[n], reverse=True):
+        if all(G.has_edge(v, u) for u in clique):
+            clique.append(v)
+    return clique
+
+
+def resolver_distribuido(grafo_obj, n_workers=2, host="localhost", puerto=0,
+                         clave=CLAVE_POR_DEFECTO, fallar_tras_nodos=None):
+    """
+    Resuelve el clique máximo de `grafo_obj` con un coordinador y
+    `n_workers` procesos locales conectados por TCP.
+
+    Con n_workers=0 no se lanzan procesos locales y el coordinador espera
+    workers externos (python distribuido.py worker HOST PUERTO).
+
+    Args:
+        fallar_tras_nodos: dict {índice_worker: nodos} para simular caídas
+
+    Returns:
+        diccionario con el clique (etiquetas originales) y estadísticas
+    """
+    nodos, adyacencia = grafo_obj.compactar(orden_degeneracion(grafo_obj.G))
+    indice = {v: i for i, v in enumerate(nodos)}
+    inicial = [indice[v] for v in clique_voraz(grafo_obj.G)]
+
+    coordinador = Coordinador(adyacencia, inicial, host, puerto, clave)
+    host, puerto = coordinador.direccion
+    print(f"   • Coordinador escuchando en {host}:{puerto}")
+
+    fallos = fallar_tras_nodos or {}
+    procesos = []
+    for i in range(n_workers):
+        p = multiprocessing.Process(
+            target=ejecutar_worker,
+            args=(host, puerto, clave, fallos.get(i)),
+            daemon=True,
+        )
+        p.start()
+        procesos.append(p)
+
+    try:
+        resultado = coordinador.resolver(procesos, esperar_workers=max(n_workers, 1))
+    finally:
+        for p in procesos:
+            p.join(timeout=5)
+            if p.is_alive():
+                p.terminate()
+
+    resultado["clique"] = [nodos[i] for i in resultado["clique"]]
+    return resultado
+
+
+def medir_escalabilidad(grafo_obj, lista_workers=(1, 2, 4)):
+    """
+    Ejecuta la búsqueda distribuida con distinta cantidad de workers sobre
+    el MISMO grafo e informa speedup y eficiencia de escalado
+    (eficiencia = T1 / (p * Tp), tomando como T1 la corrida con 1 worker).
+
+    La corrida con 1 worker se agrega siempre, aunque no esté en la lista.
+
+    Returns:
+        lista de diccionarios, uno por cantidad de workers
+    """
+    lista_workers = sorted(set(lista_workers) | {1})
+    filas = []
+    t_base = None
+    for p in lista_workers:
+        print(f"\n--- {p} worker(s) ---")
+        resultado = resolver_distribuido(grafo_obj, n_workers=p)
+        if t_base is None:
+            t_base = resultado["tiempo"]
+        resultado["speedup"] = t_base / resultado["tiempo"] if resultado["tiempo"] > 0 else float("inf")
+        resultado["eficiencia"] = resultado["speedup"] / p
+        filas.append(resultado)
+
+    print(f"\n{'─'*60}")
+    print("📊 ESCALABILIDAD DISTRIBUIDA")
+    print(f"{'─'*60}")
+    print(f"   {'Workers':>7} {'Tiempo':>10} {'Speedup':>8} {'Eficiencia':>10} {'Utilización':>11}")
+    for p, fila in zip(lista_workers, filas):
+        print(f"   {p:>7} {fila['tiempo']:>9.4f}s {fila['speedup']:>7.2f}x "
+              f"{fila['eficiencia']*100:>9.1f}% {fila['utilizacion']*100:>10.1f}%")
+    print(f"{'─'*60}")
+    return filas
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "worker":
+        try:
+            ejecutar_worker(sys.argv[2], int(sys.argv[3]))
+        except ValueError as e:
+            print(f"⚠️  {e}")
+            sys.exit(1)
+    else:
+        print("Uso: python distribuido.py worker HOST PUERTO")
+        sys.exit(1)
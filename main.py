@@ -1,9 +1,19 @@
+import os
 import sys
 from Grafo import Grafo
-from utils import graficar_resultados, graficar_comparacion, limpiar_resultados, guardar_resultado
+from memoria import medir_corrida
+from utils import (graficar_resultados, graficar_comparacion, limpiar_resultados, guardar_resultado,
+                   guardar_perfil_local)
+
+
+CHECKPOINT_EXACTO = "checkpoint_exacto_multiple.json"
+CHECKPOINT_HEURISTICO = "checkpoint_heuristico_multiple.json"
 
 
 def main():
+    if "--resume" in sys.argv[1:]:
+        reanudar_experimentos()
+    
     while True:
         print("\n" + "="*60)
         print("PROBLEMA DEL CLIQUE MÁXIMO - MENÚ PRINCIPAL")
@@ -18,9 +28,13 @@ def main():
         print(" 7: Multiples pruebas algoritmo HEURÍSTICO (Punto 7)")
         print(" 8: Graficar HEURÍSTICO - múltiples pruebas (Punto 7)")
         print(" 9: Limpiar todos los archivos de resultados")
+        print("10: Algoritmo EXACTO DISTRIBUIDO (coordinador/workers TCP)")
+        print("11: HEURÍSTICA en STREAMING sobre archivo de aristas")
+        print("12: Consulta de DECISIÓN (¿clique ≥ k?) vs EXACTO")
+        print("13: PERFIL LOCAL - mayor clique de cada vértice")
         print(" 0: Salir")
         
-        opcion = input("\n👉 Seleccione una opción (0-9): ").strip()
+        opcion = input("\n👉 Seleccione una opción (0-13): ").strip()
         
         if opcion == "1":
             ejecutar_exacto_una_vez()
@@ -40,6 +54,14 @@ def main():
             graficar_resultados("resultados_heuristico_multiple.txt")
         elif opcion == "9":
             limpiar_resultados()
+        elif opcion == "10":
+            ejecutar_exacto_distribuido()
+        elif opcion == "11":
+            ejecutar_heuristica_streaming()
+        elif opcion == "12":
+            ejecutar_benchmark_decision()
+        elif opcion == "13":
+            ejecutar_perfil_local()
         elif opcion == "0":
             print("\n👋 Saliendo del programa.")
             sys.exit(0)
@@ -47,6 +69,39 @@ def main():
             print("\n⚠️  Opción no válida. Intente nuevamente.")
 
 
+def reanudar_experimentos():
+    """Continúa los barridos (Puntos 3 y 7) que quedaron interrumpidos"""
+    pendientes = False
+    if os.path.exists(CHECKPOINT_EXACTO):
+        pendientes = True
+        Grafo.recorrer_exacto_multiple(reanudar=True)
+    if os.path.exists(CHECKPOINT_HEURISTICO):
+        pendientes = True
+        Grafo.recorrer_heuristico_multiple(reanudar=True)
+    if not pendientes:
+        print("\n💡 No hay experimentos interrumpidos para reanudar.")
+
+
+def preguntar_reanudar(checkpoint):
+    """Si hay un barrido interrumpido, pregunta si se quiere continuar"""
+    if not os.path.exists(checkpoint):
+        return False
+    respuesta = input("\n▶️  Hay un experimento interrumpido. ¿Reanudarlo? (s/n): ").strip().lower()
+    return respuesta.startswith('s')
+
+
+def pedir_limite_memoria():
+    """Pregunta un límite de memoria opcional (MB de RSS) para abortar corridas"""
+    texto = input("🧠 Límite de memoria (RSS del proceso) en MB (vacío = sin límite): ").strip()
+    if not texto:
+        return None
+    try:
+        return float(texto)
+    except ValueError:
+        print("⚠️  Entrada no válida. Se ejecuta sin límite de memoria.")
+        return None
+
+
 def ejecutar_exacto_una_vez():
     """PUNTO 2: Ejecuta el algoritmo exacto una sola vez"""
     print("\n" + "="*60)
@@ -60,9 +115,12 @@ def ejecutar_exacto_una_vez():
         print("⚠️  Entrada no válida.")
         return
     
+    limite = pedir_limite_memoria()
+    
     grafo = Grafo(n, p)
-    grafo.generar()
-    grafo.recorrer_exacto()
+    grafo.memoria = medir_corrida(grafo.generar, grafo.recorrer_exacto, limite)
+    if grafo.memoria is None:
+        return
     
     # Guardar resultados DESPUÉS de ejecutar
     guardar_resultado(grafo, "exacto", "resultados_exacto.txt")
@@ -78,6 +136,10 @@ def ejecutar_experimentacion_exacto():
     print("\nEsto ejecutará el algoritmo exacto con tamaños crecientes de grafos.")
     print("Se detendrá automáticamente al alcanzar el tiempo máximo.\n")
     
+    if preguntar_reanudar(CHECKPOINT_EXACTO):
+        Grafo.recorrer_exacto_multiple(reanudar=True)
+        return
+    
     # Preguntar si quiere limpiar datos anteriores
     limpiar = input("¿Deseas borrar los datos anteriores? (s/n): ").strip().lower()
     limpiar_anterior = limpiar.startswith('s')
@@ -88,7 +150,53 @@ def ejecutar_experimentacion_exacto():
         print("⚠️  Entrada no válida. Usando 1800 segundos (30 min) por defecto.")
         duracion = 1800
     
-    Grafo.recorrer_exacto_multiple(duracion_maxima=duracion, limpiar_anterior=limpiar_anterior)
+    limite = pedir_limite_memoria()
+    
+    Grafo.recorrer_exacto_multiple(duracion_maxima=duracion, limpiar_anterior=limpiar_anterior,
+                                   limite_memoria_mb=limite)
+
+
+def ejecutar_exacto_distribuido():
+    """Ejecuta el algoritmo exacto distribuido y mide su escalabilidad"""
+    print("\n" + "="*60)
+    print("ALGORITMO EXACTO DISTRIBUIDO - Coordinador/Workers")
+    print("="*60)
+    print("\nLos workers se lanzan como procesos locales conectados por TCP.")
+    print("Con 0 workers el coordinador espera workers externos:")
+    print("   python distribuido.py worker HOST PUERTO\n")
+    
+    try:
+        n = int(input("\n📊 Ingrese la cantidad de nodos del grafo: "))
+        p = float(input("🔗 Probabilidad de conexión (0 a 1, ej. 0.3): "))
+        n_workers = int(input("🖥️  Cantidad de workers locales (ej. 4): "))
+    except ValueError:
+        print("⚠️  Entrada no válida.")
+        return
+    
+    limite = pedir_limite_memoria()
+    
+    # El límite y el pico RSS son los del coordinador; cada worker informa su pico
+    grafo = Grafo(n, p)
+    resultado = {}
+    def resolver():
+        resultado.update(grafo.recorrer_exacto_distribuido(n_workers=n_workers))
+    
+    grafo.memoria = medir_corrida(grafo.generar, resolver, limite)
+    if grafo.memoria is None:
+        return
+    grafo.memoria["rss_workers_mb"] = resultado["rss_workers_mb"]
+    
+    # Guardar resultados DESPUÉS de ejecutar
+    guardar_resultado(grafo, "distribuido", "resultados_exacto_distribuido.txt")
+    
+    print("\n✅ Resultados guardados en 'resultados_exacto_distribuido.txt'")
+    
+    if n_workers > 1:
+        medir = input("\n¿Medir eficiencia de escalado (1 a N workers)? (s/n): ").strip().lower()
+        if medir.startswith('s'):
+            from distribuido import medir_escalabilidad
+            lista = sorted({1, *range(2, n_workers + 1, 2), n_workers})
+            medir_escalabilidad(grafo, lista)
 
 
 def ejecutar_heuristica_una_vez():
@@ -104,9 +212,12 @@ def ejecutar_heuristica_una_vez():
         print("⚠️  Entrada no válida.")
         return
     
+    limite = pedir_limite_memoria()
+    
     grafo = Grafo(n, p)
-    grafo.generar()
-    grafo.recorrer_heuristico()
+    grafo.memoria = medir_corrida(grafo.generar, grafo.recorrer_heuristico, limite)
+    if grafo.memoria is None:
+        return
     
     # Guardar resultados DESPUÉS de ejecutar
     guardar_resultado(grafo, "heuristico", "resultados_heuristico.txt")
@@ -114,6 +225,99 @@ def ejecutar_heuristica_una_vez():
     print("\n✅ Resultados guardados en 'resultados_heuristico.txt'")
 
 
+def ejecutar_heuristica_streaming():
+    """Ejecuta la heurística semi-streaming sobre un archivo de aristas"""
+    from streaming import GrafoStreaming, generar_lista_aristas
+    
+    print("\n" + "="*60)
+    print("HEURÍSTICA EN STREAMING - Archivo de aristas")
+    print("="*60)
+    print("\nEl grafo NUNCA se carga completo: se hacen 3 pasadas sobre el archivo.")
+    print("Formato: una arista 'u v' por línea (enteros no negativos).\n")
+    
+    ruta = input("📂 Ruta del archivo de aristas (vacío = generar uno): ").strip()
+    if not ruta:
+        try:
+            n = int(input("\n📊 Ingrese la cantidad de nodos del grafo: "))
+            p = float(input("🔗 Probabilidad de conexión (0 a 1, ej. 0.3): "))
+        except ValueError:
+            print("⚠️  Entrada no válida.")
+            return
+    limite = pedir_limite_memoria()
+    
+    generar = None
+    if not ruta:
+        ruta = "aristas_streaming.txt"
+        def generar():
+            aristas = generar_lista_aristas(ruta, n, p)
+            print(f"✓ Archivo generado: '{ruta}' ({aristas} aristas)")
+    
+    grafo = GrafoStreaming(ruta)
+    try:
+        grafo.memoria = medir_corrida(generar, grafo.recorrer_heuristico_streaming, limite)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"⚠️  No se pudo leer el archivo: {e}")
+        return
+    if grafo.memoria is None:
+        return
+    
+    # Guardar resultados DESPUÉS de ejecutar
+    guardar_resultado(grafo, "streaming", "resultados_heuristico_streaming.txt")
+    
+    print("\n✅ Resultados guardados en 'resultados_heuristico_streaming.txt'")
+
+
+def ejecutar_benchmark_decision():
+    """Compara la consulta de decisión (¿clique ≥ k?) con la optimización completa"""
+    print("\n" + "="*60)
+    print("CONSULTA DE DECISIÓN vs OPTIMIZACIÓN COMPLETA")
+    print("="*60)
+    
+    try:
+        n = int(input("\n📊 Ingrese la cantidad de nodos del grafo: "))
+        p = float(input("🔗 Probabilidad de conexión (0 a 1, ej. 0.3): "))
+        texto = input("🎯 Valores de k separados por coma (vacío = alrededor de ω): ").strip()
+        valores_k = [int(k) for k in texto.split(",")] if texto else None
+    except ValueError:
+        print("⚠️  Entrada no válida.")
+        return
+    
+    limite = pedir_limite_memoria()
+    
+    Grafo.recorrer_decision_benchmark(n, p, valores_k, limite_memoria_mb=limite)
+
+
+def ejecutar_perfil_local():
+    """Calcula el tamaño del mayor clique que contiene a cada vértice"""
+    print("\n" + "="*60)
+    print("PERFIL LOCAL DE CLIQUES - Mayor clique por vértice")
+    print("="*60)
+    
+    try:
+        n = int(input("\n📊 Ingrese la cantidad de nodos del grafo: "))
+        p = float(input("🔗 Probabilidad de conexión (0 a 1, ej. 0.3): "))
+    except ValueError:
+        print("⚠️  Entrada no válida.")
+        return
+    
+    limite = pedir_limite_memoria()
+    
+    # El pico RSS es el del proceso principal, no el de los procesos del pool
+    grafo = Grafo(n, p)
+    resultado = {}
+    def resolver():
+        resultado["perfil"] = grafo.recorrer_perfil_local()
+    
+    grafo.memoria = medir_corrida(grafo.generar, resolver, limite)
+    if grafo.memoria is None:
+        return
+    
+    # Guardar resultados DESPUÉS de ejecutar
+    guardar_perfil_local(grafo, resultado["perfil"], "resultados_perfil_local.txt")
+    
+    print("\n✅ Resultados guardados en 'resultados_perfil_local.txt'")
+
+
 def ejecutar_comparacion():
     """PUNTO 6: Compara exacto vs heurístico en los MISMOS casos con tamaños fijos"""
     print("\n" + "="*60)
@@ -127,12 +331,14 @@ def ejecutar_comparacion():
     limpiar = input("¿Deseas borrar los datos anteriores? (s/n): ").strip().lower()
     limpiar_anterior = limpiar.startswith('s')
     
+    limite = pedir_limite_memoria()
+    
     confirmar = input("\n¿Desea continuar? (s/n): ").lower()
     if not confirmar.startswith('s'):
         print("Operación cancelada.")
         return
     
-    Grafo.recorrer_comparacion(limpiar_anterior=limpiar_anterior)
+    Grafo.recorrer_comparacion(limpiar_anterior=limpiar_anterior, limite_memoria_mb=limite)
 
 
 def ejecutar_escalabilidad_heuristica():
@@ -143,6 +349,10 @@ def ejecutar_escalabilidad_heuristica():
     print("\nSe ejecutará la heurística con grafos de tamaño grande (n >= 1000).")
     print("Esto demuestra su viabilidad en casos reales.\n")
     
+    if preguntar_reanudar(CHECKPOINT_HEURISTICO):
+        Grafo.recorrer_heuristico_multiple(reanudar=True)
+        return
+    
     # Preguntar si quiere limpiar datos anteriores
     limpiar = input("¿Deseas borrar los datos anteriores? (s/n): ").strip().lower()
     limpiar_anterior = limpiar.startswith('s')
@@ -153,7 +363,10 @@ def ejecutar_escalabilidad_heuristica():
         print("⚠️  Entrada no válida. Usando 1200 segundos (20 min) por defecto.")
         duracion = 1200
     
-    Grafo.recorrer_heuristico_multiple(duracion_maxima=duracion, limpiar_anterior=limpiar_anterior)
+    limite = pedir_limite_memoria()
+    
+    Grafo.recorrer_heuristico_multiple(duracion_maxima=duracion, limpiar_anterior=limpiar_anterior,
+                                       limite_memoria_mb=limite)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,251 @@
+"""
+Medición de memoria de cada ejecución de los experimentos.
+
+Por cada corrida se registra siempre, sin costo para la resolución:
+- Crecimiento del RSS en la GENERACIÓN y en la RESOLUCIÓN (pico de la fase
+  menos el RSS al empezarla), así no cuentan el intérprete ni la memoria
+  que dejaron corridas anteriores. Solo en Linux (/proc/self/clear_refs).
+- Pico de RSS del proceso (memoria real ocupada, en valor absoluto).
+
+Con la variable de entorno CLIQUE_TRACEMALLOC=1 se registra además el pico
+de memoria de Python (tracemalloc) en la GENERACIÓN y en la RESOLUCIÓN.
+tracemalloc hace mucho más lentas las resoluciones que asignan memoria
+(unas 5x en recorrer_exacto), así que con esa opción los tiempos medidos no
+son comparables con los de las corridas sin ella.
+
+Opcionalmente se fija un límite de RSS del proceso (MB): si se supera, la
+corrida se aborta con MemoriaExcedida en lugar de dejar que el sistema
+mate el proceso.
+
+Uso:
+    grafo.memoria = medir_corrida(grafo.generar, grafo.recorrer_exacto, limite_mb)
+    if grafo.memoria is None:
+        ...  # la corrida superó el límite
+"""
+import _thread
+import os
+import signal
+import sys
+import threading
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+MB = 1024 * 1024
+
+# Cada cuántos segundos se revisa el límite de memoria
+INTERVALO_LIMITE = 0.05
+
+# tracemalloc por fase solo si se pide explícitamente (infla los tiempos)
+DETALLADO_POR_DEFECTO = os.environ.get("CLIQUE_TRACEMALLOC") == "1"
+
+
+class MemoriaExcedida(MemoryError):
+    """La corrida superó el límite de memoria y fue abortada."""
+
+
+def reiniciar_pico_rss():
+    """
+    Reinicia el pico de RSS del proceso (solo Linux: /proc/self/clear_refs).
+    En otros sistemas el pico es el de toda la vida del proceso.
+
+    Returns:
+        True si se pudo reiniciar
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def pico_rss_mb():
+    """Pico de RSS del proceso en MB, o None si no se puede medir."""
+    try:
+        with open("/proc/self/status") as f:
+            for linea in f:
+                if linea.startswith("VmHWM:"):
+                    return int(linea.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is not None:
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss está en KB en Linux y en bytes en macOS
+        return pico / MB if sys.platform == "darwin" else pico / 1024
+    if psutil is not None:
+        return psutil.Process().memory_info().peak_wset / MB
+    return None
+
+
+def rss_actual_mb():
+    """RSS actual del proceso en MB (o el pico, si no se puede medir el actual)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / MB
+    except (OSError, ValueError, AttributeError):
+        pass
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / MB
+    return pico_rss_mb()
+
+
+def _interrumpir_principal():
+    """
+    Lanza KeyboardInterrupt en el hilo principal. Con una señal real (POSIX)
+    se despierta aunque esté bloqueado esperando, p. ej. en pool.map;
+    interrupt_main solo actúa cuando vuelve a ejecutar código Python.
+    """
+    if hasattr(signal, "pthread_kill"):
+        signal.pthread_kill(threading.main_thread().ident, signal.SIGINT)
+    else:
+        _thread.interrupt_main()
+
+
+class PerfilMemoria:
+    """
+    Mide la memoria de una corrida separada por fases.
+
+    Args:
+        limite_mb: RSS máximo del proceso (MB) durante la corrida;
+                   None = sin límite
+        detallado: si True, mide con tracemalloc el pico de cada fase
+                   (por defecto, según CLIQUE_TRACEMALLOC)
+    """
+
+    def __init__(self, limite_mb=None, detallado=None):
+        self.limite_mb = limite_mb
+        self.detallado = DETALLADO_POR_DEFECTO if detallado is None else detallado
+        self.fases = {}
+        self.fases_rss = {}
+        self.rss_pico_mb = None
+        self._picos_fases = []
+        self.excedido = False
+        self._propio = False
+        self._detener = threading.Event()
+        self._vigia = None
+
+    def __enter__(self):
+        reiniciar_pico_rss()
+        if self.detallado and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._propio = True
+        if self.limite_mb is not None:
+            self._vigia = threading.Thread(target=self._vigilar, daemon=True)
+            self._vigia.start()
+        return self
+
+    def _vigilar(self):
+        while not self._detener.wait(INTERVALO_LIMITE):
+            rss = rss_actual_mb()
+            if rss is not None and rss > self.limite_mb:
+                self.excedido = True
+                # Interrumpe al hilo principal; __exit__ lo convierte en MemoriaExcedida
+                _interrumpir_principal()
+                return
+
+    def __exit__(self, tipo, valor, traza):
+        try:
+            self._detener.set()
+            if self._vigia is not None:
+                self._vigia.join()
+        except KeyboardInterrupt:
+            if not self.excedido:
+                raise
+            tipo = KeyboardInterrupt
+        finally:
+            # Cada fase reinicia el pico: el de la corrida es el mayor de todos
+            picos = [p for p in self._picos_fases + [pico_rss_mb()] if p is not None]
+            self.rss_pico_mb = max(picos, default=None)
+            if self._propio:
+                tracemalloc.stop()
+
+        if self.excedido and (tipo is None or issubclass(tipo, KeyboardInterrupt)):
+            raise MemoriaExcedida(
+                f"Corrida abortada: el proceso superó el límite de {self.limite_mb} MB de RSS"
+            ) from None
+        return False
+
+    def fase(self, nombre):
+        """Context manager que registra el crecimiento de RSS (y el pico de tracemalloc) de una fase."""
+        return _Fase(self, nombre)
+
+    def resumen(self):
+        """
+        Returns:
+            diccionario con generacion_rss_mb, resolucion_rss_mb (crecimiento
+            de RSS), generacion_mb, resolucion_mb (tracemalloc) y rss_pico_mb
+            (None en lo que no se midió)
+        """
+        return {
+            "generacion_rss_mb": self.fases_rss.get("generacion"),
+            "resolucion_rss_mb": self.fases_rss.get("resolucion"),
+            "generacion_mb": self.fases.get("generacion"),
+            "resolucion_mb": self.fases.get("resolucion"),
+            "rss_pico_mb": self.rss_pico_mb,
+        }
+
+
+class _Fase:
+    def __init__(self, perfil, nombre):
+        self.perfil = perfil
+        self.nombre = nombre
+        self._inicio = 0
+        self._rss_inicio = None
+
+    def __enter__(self):
+        # Sin poder reiniciar el pico, la resta incluiría corridas anteriores
+        self.perfil._picos_fases.append(pico_rss_mb())
+        if reiniciar_pico_rss():
+            self._rss_inicio = rss_actual_mb()
+        if self.perfil.detallado:
+            tracemalloc.reset_peak()
+            self._inicio = tracemalloc.get_traced_memory()[0]
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        pico_rss = pico_rss_mb()
+        self.perfil._picos_fases.append(pico_rss)
+        if self._rss_inicio is not None and pico_rss is not None:
+            self.perfil.fases_rss[self.nombre] = max(pico_rss - self._rss_inicio, 0.0)
+        if self.perfil.detallado:
+            pico = tracemalloc.get_traced_memory()[1]
+            self.perfil.fases[self.nombre] = (pico - self._inicio) / MB
+        return False
+
+
+def medir_corrida(generar=None, resolver=None, limite_mb=None, mostrar=True):
+    """
+    Ejecuta generar() y resolver() (los que se indiquen) midiendo la memoria
+    de cada fase, y la muestra en consola.
+
+    Returns:
+        resumen de PerfilMemoria, o None si la corrida superó el límite
+    """
+    from utils import mostrar_memoria
+
+    try:
+        with PerfilMemoria(limite_mb) as perfil:
+            if generar is not None:
+                with perfil.fase("generacion"):
+                    generar()
+            if resolver is not None:
+                with perfil.fase("resolucion"):
+                    resolver()
+    except MemoriaExcedida as e:
+        print(f"\n🧯 {e}")
+        return None
+
+    resumen = perfil.resumen()
+    if mostrar:
+        mostrar_memoria(resumen)
+    return resumen
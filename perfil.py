@@ -0,0 +1,130 @@
+"""
+Perfil local de cliques: para cada vértice, el tamaño del mayor clique que lo contiene.
+
+En lugar de resolver un clique máximo por cada red ego, se comparte trabajo:
+
+- Los vértices se procesan en orden de degeneración (los de mayor core
+  primero), así los cliques grandes aparecen pronto.
+- Cada clique encontrado es testigo para TODOS sus miembros: su tamaño
+  pasa a ser cota inferior de cada uno.
+- La cota superior es core + 1; si coincide con la inferior, el vértice se
+  resuelve sin buscar.
+- La búsqueda de un vértice solo usa vecinos con core suficiente para
+  superar su cota inferior, y corta con la cota de coloreo.
+
+Los vértices se reparten por lotes en un pool de procesos; entre lote y
+lote se actualizan las cotas con los cliques encontrados.
+"""
+import multiprocessing
+import os
+from bisect import bisect_left
+
+import networkx as nx
+
+from bitsets import clique_maximo
+
+
+# Grafo compacto de cada proceso del pool (se envía una sola vez)
+_ADYACENCIA = None
+_CORES = None
+
+
+def _iniciar(adyacencia, cores):
+    global _ADYACENCIA, _CORES
+    _ADYACENCIA = adyacencia
+    _CORES = cores
+
+
+def _resolver_vertice(tarea):
+    """
+    Busca el mayor clique que contiene al vértice, solo si supera su cota inferior.
+
+    Returns:
+        (vértice, clique) con el clique como tupla de índices, o None si no
+        hay uno mayor que la cota
+    """
+    v, cota_inferior = tarea
+    # Un clique de más de `cota_inferior` vértices exige core >= cota_inferior
+    # en cada miembro: los índices están ordenados por core
+    primero = bisect_left(_CORES, cota_inferior)
+    candidatos = _ADYACENCIA[v] & ~((1 << primero) - 1)
+    hallado = clique_maximo(candidatos, _ADYACENCIA, mejor=cota_inferior - 1)
+    return v, None if hallado is None else (v,) + hallado
+
+
+def perfil_clique_local(grafo_obj, vertices=None, procesos=None, tamaño_lote=None):
+    """
+    Calcula el tamaño del mayor clique que contiene a cada vértice.
+
+    Args:
+        grafo_obj: instancia de la clase Grafo
+        vertices: subconjunto de vértices a calcular (por defecto, todos)
+        procesos: procesos del pool (por defecto, uno por núcleo; 1 = sin pool)
+        tamaño_lote: vértices por lote entre actualizaciones de cotas
+                     (por defecto, 4 por proceso)
+
+    Returns:
+        diccionario con el perfil {vértice: tamaño} y estadísticas
+    """
+    G = grafo_obj.G
+    cores = nx.core_number(G)
+    nodos, adyacencia = grafo_obj.compactar(sorted(G.nodes(), key=lambda v: cores[v]))
+    cores_orden = [cores[v] for v in nodos]
+
+    if vertices is None:
+        objetivo = list(range(len(nodos)))
+    else:
+        indice = {v: i for i, v in enumerate(nodos)}
+        objetivo = [indice[v] for v in vertices]
+    # Orden de degeneración inverso: los de mayor core primero
+    pendientes = sorted(objetivo, key=cores_orden.__getitem__, reverse=True)
+
+    inferior = [2 if adyacencia[i] else 1 for i in range(len(nodos))]
+    superior = [c + 1 for c in cores_orden]
+
+    procesos = procesos or os.cpu_count() or 1
+    tamaño_lote = tamaño_lote or 4 * procesos
+
+    perfil = {}
+    sin_busqueda = 0
+    pool = None
+    if procesos > 1:
+        pool = multiprocessing.Pool(procesos, initializer=_iniciar, initargs=(adyacencia, cores_orden))
+    else:
+        _iniciar(adyacencia, cores_orden)
+
+    try:
+        posicion = 0
+        while posicion < len(pendientes):
+            tareas = []
+            while posicion < len(pendientes) and len(tareas) < tamaño_lote:
+                i = pendientes[posicion]
+                posicion += 1
+                if inferior[i] >= superior[i]:
+                    perfil[i] = inferior[i]
+                    sin_busqueda += 1
+                else:
+                    tareas.append((i, inferior[i]))
+
+            salidas = pool.map(_resolver_vertice, tareas) if pool else map(_resolver_vertice, tareas)
+            for i, clique in salidas:
+                if clique is not None:
+                    # El clique es testigo para todos sus miembros
+                    for u in clique:
+                        inferior[u] = max(inferior[u], len(clique))
+                perfil[i] = inferior[i]
+    except BaseException:
+        # Interrupción (Ctrl-C o límite de memoria): no esperar el lote en curso
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        raise
+    if pool is not None:
+        pool.close()
+        pool.join()
+
+    return {
+        "perfil": {nodos[i]: perfil[i] for i in objetivo},
+        "sin_busqueda": sin_busqueda,
+        "procesos": procesos,
+    }
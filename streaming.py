@@ -0,0 +1,318 @@
+"""
+Heurística de clique en SEMI-STREAMING sobre listas de aristas más grandes que la RAM.
+
+El grafo nunca se materializa completo: se hacen (al menos) tres pasadas
+secuenciales sobre el archivo (leído por bloques con mmap):
+
+  1. Conteo de grados.                           Memoria: O(n)
+  2. Poda de candidatos por grado y por grado
+     interno (estimación de core).               Memoria: O(n + candidatos)
+  3. Construcción del subgrafo de sobrevivientes
+     (bitsets) y clique voraz por orden de core.  Memoria: O(n + subgrafo²/8 bytes)
+
+Las pasadas 2 y 3 se repiten (hasta MAX_RONDAS veces) mientras sirvan: los
+candidatos con grado interno menor que el clique encontrado no pueden estar
+en uno mayor y se descartan, y si la cota de core no supera al clique
+encontrado, se termina.
+
+Formato del archivo: una arista "u v" por línea, con u y v enteros no
+negativos; las líneas que empiezan con '#' o '%' se ignoran. Se asume un
+grafo simple (cada arista no dirigida aparece una sola vez).
+"""
+import heapq
+import mmap
+import math
+import random
+import time
+from array import array
+
+from bitsets import numeros_core
+
+
+# Tamaño de cada bloque leído del archivo mapeado en memoria
+TAMAÑO_BLOQUE = 1024 * 1024
+
+# Candidatos que sobreviven la poda por grado (pasada 1 → 2)
+MAX_CANDIDATOS = 20000
+
+# Vértices cuyo subgrafo inducido se construye en memoria (pasada 2 → 3)
+MAX_SUBGRAFO = 2000
+
+# Rondas de poda por core (pasadas 2 y 3 repetidas)
+MAX_RONDAS = 3
+
+
+# ===================================================================
+# LECTURA POR BLOQUES
+# ===================================================================
+
+def leer_aristas(ruta, tamaño_bloque=TAMAÑO_BLOQUE):
+    """
+    Recorre el archivo de aristas por bloques usando mmap.
+    Genera, por cada bloque, la lista plana [u1, v1, u2, v2, ...].
+    """
+    with open(ruta, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # archivo vacío
+        with mm:
+            inicio = 0
+            total = len(mm)
+            while inicio < total:
+                fin = min(inicio + tamaño_bloque, total)
+                if fin < total:
+                    # Cortar en el último salto de línea para no partir aristas
+                    corte = mm.rfind(b"\n", inicio, fin)
+                    if corte == -1:
+                        # Línea más larga que el bloque: extender hasta su final
+                        corte = mm.find(b"\n", fin)
+                    fin = total if corte == -1 else corte + 1
+                bloque = mm[inicio:fin]
+                inicio = fin
+
+                if b"#" in bloque or b"%" in bloque:
+                    bloque = b"\n".join(
+                        linea for linea in bloque.splitlines()
+                        if not linea.lstrip().startswith((b"#", b"%"))
+                    )
+                yield list(map(int, bloque.split()))
+
+
+def _pares(ids):
+    it = iter(ids)
+    return zip(it, it)
+
+
+# ===================================================================
+# GENERACIÓN DE ARCHIVOS DE PRUEBA
+# ===================================================================
+
+def generar_lista_aristas(ruta, n_nodos, probabilidad, semilla=None):
+    """
+    Escribe un grafo Erdős–Rényi G(n, p) directamente a disco, arista por
+    arista (método de Batagelj-Brandes), sin construirlo en memoria.
+
+    Returns:
+        cantidad de aristas escritas
+    """
+    rng = random.Random(semilla)
+    aristas = 0
+    with open(ruta, "w", encoding="utf-8") as f:
+        if probabilidad <= 0:
+            return 0
+        if probabilidad >= 1:
+            for v in range(1, n_nodos):
+                for w in range(v):
+                    f.write(f"{v} {w}\n")
+            return n_nodos * (n_nodos - 1) // 2
+
+        lp = math.log(1.0 - probabilidad)
+        v, w = 1, -1
+        while v < n_nodos:
+            w += 1 + int(math.log(1.0 - rng.random()) / lp)
+            while w >= v and v < n_nodos:
+                w -= v
+                v += 1
+            if v < n_nodos:
+                f.write(f"{v} {w}\n")
+                aristas += 1
+    return aristas
+
+
+# ===================================================================
+# PASADAS
+# ===================================================================
+
+def contar_grados(ruta):
+    """PASADA 1: grado de cada vértice en un array compacto (4 bytes por vértice)."""
+    grados = array("I")
+    aristas = 0
+    for ids in leer_aristas(ruta):
+        if not ids:
+            continue
+        maximo = max(ids)
+        if maximo >= len(grados):
+            grados.extend(array("I", [0]) * (maximo + 1 - len(grados)))
+        for u, v in _pares(ids):
+            if u != v:
+                grados[u] += 1
+                grados[v] += 1
+                aristas += 1
+    return grados, aristas
+
+
+def grados_internos(ruta, candidatos):
+    """
+    PASADA 2: para cada candidato, cuántos de sus vecinos también son
+    candidatos (estimación de su core dentro del conjunto).
+    """
+    posicion = {v: i for i, v in enumerate(candidatos)}
+    internos = array("I", [0]) * len(candidatos)
+    for ids in leer_aristas(ruta):
+        for u, v in _pares(ids):
+            iu = posicion.get(u)
+            if iu is None:
+                continue
+            iv = posicion.get(v)
+            if iv is None or iu == iv:
+                continue
+            internos[iu] += 1
+            internos[iv] += 1
+    return internos
+
+
+def cota_core(internos):
+    """
+    Cota superior del clique entre los candidatos: si solo h de ellos tienen
+    grado interno >= h, ningún clique supera h+1 vértices.
+    """
+    ordenados = sorted(internos, reverse=True)
+    return 1 + sum(1 for i, d in enumerate(ordenados, 1) if d >= i)
+
+
+def construir_subgrafo(ruta, sobrevivientes):
+    """PASADA 3: adyacencia (bitsets) del subgrafo inducido por los sobrevivientes."""
+    posicion = {v: i for i, v in enumerate(sobrevivientes)}
+    adyacencia = [0] * len(sobrevivientes)
+    for ids in leer_aristas(ruta):
+        for u, v in _pares(ids):
+            iu = posicion.get(u)
+            if iu is None:
+                continue
+            iv = posicion.get(v)
+            if iv is None or iu == iv:
+                continue
+            adyacencia[iu] |= 1 << iv
+            adyacencia[iv] |= 1 << iu
+    return adyacencia
+
+
+# ===================================================================
+# CLIQUE SOBRE EL SUBGRAFO EN MEMORIA
+# ===================================================================
+
+def clique_voraz_por_core(adyacencia, intentos=64):
+    """
+    Misma estrategia voraz que recorrer_heuristico, pero ordenando por
+    (core, grado) y probando varios vértices iniciales.
+    """
+    if not adyacencia:
+        return []
+    core = numeros_core(adyacencia)
+    ranking = sorted(
+        range(len(adyacencia)),
+        key=lambda v: (core[v], bin(adyacencia[v]).count("1")),
+        reverse=True,
+    )
+
+    mejor = []
+    for inicio in ranking[:intentos]:
+        # Un clique que contiene a `inicio` no puede superar core+1
+        if core[inicio] + 1 <= len(mejor):
+            continue
+        clique = [inicio]
+        candidatos = adyacencia[inicio]
+        for u in ranking:
+            if not candidatos:
+                break
+            if candidatos >> u & 1:
+                clique.append(u)
+                candidatos &= adyacencia[u]
+        if len(clique) > len(mejor):
+            mejor = clique
+    return mejor
+
+
+# ===================================================================
+# RESULTADO COMPATIBLE CON guardar_resultado
+# ===================================================================
+
+class GrafoStreaming:
+    """
+    Grafo leído en streaming desde un archivo de aristas.
+    Expone los mismos campos que usa guardar_resultado (n_nodos,
+    probabilidad, aristas, clique_maximo, tiempo) sin guardar el grafo.
+    """
+
+    def __init__(self, ruta, max_candidatos=MAX_CANDIDATOS, max_subgrafo=MAX_SUBGRAFO,
+                 max_rondas=MAX_RONDAS):
+        self.ruta = ruta
+        self.max_candidatos = max_candidatos
+        self.max_subgrafo = max_subgrafo
+        self.max_rondas = max_rondas
+        self.G = None
+        self.n_nodos = 0
+        self.n_aristas = 0
+        self.probabilidad = 0.0
+        self.clique_maximo = []
+        self.tiempo = 0.0
+        self.memoria = None
+
+    def recorrer_heuristico_streaming(self):
+        """
+        Heurística de clique en pasadas secuenciales sobre el archivo
+        (3, más 2 por cada ronda extra de poda por core).
+
+        NOTA: Esta función NO guarda resultados automáticamente.
+        """
+        print("\n🌊 Ejecutando heurística en STREAMING...\n")
+
+        start = time.time()
+        self.clique_maximo = []
+
+        # Pasada 1: grados
+        grados, self.n_aristas = contar_grados(self.ruta)
+        self.n_nodos = len(grados)
+        if self.n_nodos > 1:
+            self.probabilidad = round(2 * self.n_aristas / (self.n_nodos * (self.n_nodos - 1)), 6)
+        print(f"   > Pasada 1: {self.n_nodos} nodos, {self.n_aristas} aristas")
+
+        # Poda por grado: los de mayor grado, y solo si pueden superar
+        # el clique trivial de una arista. nlargest no arma una lista de
+        # todos los vértices: memoria O(candidatos) además del array
+        candidatos = [
+            v for v in heapq.nlargest(self.max_candidatos, range(self.n_nodos), key=grados.__getitem__)
+            if grados[v] >= 1
+        ]
+        del grados
+
+        for ronda in range(1, self.max_rondas + 1):
+            # Pasada 2: grado interno entre candidatos (estimación de core)
+            internos = grados_internos(self.ruta, candidatos)
+            cota = cota_core(internos)
+            print(f"   > Ronda {ronda}, pasada 2: {len(candidatos)} candidatos (cota de clique ≤ {cota})")
+            if cota <= len(self.clique_maximo):
+                print("     Ningún clique entre los candidatos supera al encontrado.")
+                break
+
+            # Pasada 3: subgrafo de los de mayor grado interno y clique voraz
+            orden = sorted(range(len(candidatos)), key=internos.__getitem__, reverse=True)
+            sobrevivientes = [candidatos[i] for i in orden[:self.max_subgrafo] if internos[i] >= 1]
+            del orden
+            adyacencia = construir_subgrafo(self.ruta, sobrevivientes)
+            clique = [sobrevivientes[i] for i in clique_voraz_por_core(adyacencia)]
+            del adyacencia
+            if len(clique) > len(self.clique_maximo):
+                self.clique_maximo = clique
+            print(f"     Pasada 3: subgrafo de {len(sobrevivientes)} sobrevivientes, "
+                  f"clique voraz de tamaño {len(clique)}")
+            if cota <= len(self.clique_maximo):
+                print("     El clique alcanza la cota de core: es óptimo entre los candidatos.")
+                break
+            if len(sobrevivientes) == len(candidatos):
+                break
+
+            # Poda por core: un clique mayor que el encontrado exige grado
+            # interno >= su tamaño en cada miembro
+            minimo = len(self.clique_maximo)
+            podados = [v for v, d in zip(candidatos, internos) if d >= minimo]
+            if len(podados) == len(candidatos):
+                break
+            candidatos = podados
+
+        self.tiempo = time.time() - start
+
+        print(f"\n✅ Clique encontrado: {self.clique_maximo}")
+        print(f"📏 Tamaño: {len(self.clique_maximo)}")
+        print(f"⏱️  Tiempo: {self.tiempo:.4f} segundos")
@@ -1,31 +1,71 @@
 import matplotlib.pyplot as plt
+import json
+import random
 import re
 import os
 
 
+METODOS = {
+    "exacto": "EXACTO (Bron-Kerbosch)",
+    "distribuido": "EXACTO DISTRIBUIDO (Ramificación y poda)",
+    "heuristico": "HEURÍSTICO (Voraz)",
+    "streaming": "HEURÍSTICO STREAMING (Semi-streaming)",
+}
+
+
 def guardar_resultado(grafo_obj, metodo, archivo):
     """
     Guarda los resultados de UNA ejecución individual en un archivo.
     
     Args:
-        grafo_obj: instancia de la clase Grafo
-        metodo: "exacto" o "heuristico"
+        grafo_obj: instancia de la clase Grafo (o GrafoStreaming)
+        metodo: "exacto", "distribuido", "heuristico" o "streaming"
         archivo: ruta del archivo donde guardar
     """
-    metodo_texto = "EXACTO (Bron-Kerbosch)" if metodo == "exacto" else "HEURÍSTICO (Voraz)"
+    metodo_texto = METODOS.get(metodo, "HEURÍSTICO (Voraz)")
+    # Los grafos leídos en streaming no guardan G, solo la cantidad de aristas
+    aristas = len(grafo_obj.G.edges) if grafo_obj.G is not None else grafo_obj.n_aristas
     
     with open(archivo, "a", encoding="utf-8") as f:
         f.write("="*60 + "\n")
         f.write(f"Método: {metodo_texto}\n")
         f.write(f"Nodos: {grafo_obj.n_nodos}\n")
         f.write(f"Probabilidad de conexión: {grafo_obj.probabilidad}\n")
-        f.write(f"Aristas: {len(grafo_obj.G.edges)}\n")
+        f.write(f"Aristas: {aristas}\n")
         f.write(f"Clique encontrado: {grafo_obj.clique_maximo}\n")
         f.write(f"Tamaño del clique: {len(grafo_obj.clique_maximo)}\n")
         f.write(f"Tiempo de ejecución: {grafo_obj.tiempo:.4f} segundos\n")
+        _escribir_memoria(f, getattr(grafo_obj, "memoria", None))
         f.write("="*60 + "\n\n")
 
 
+def _formatear_mb(valor):
+    return "N/D" if valor is None else f"{valor:.2f} MB"
+
+
+def _escribir_memoria(f, memoria):
+    """Escribe las líneas de memoria de una corrida (si se midió)."""
+    if not memoria:
+        return
+    f.write(f"Memoria generación (RSS): {_formatear_mb(memoria['generacion_rss_mb'])}\n")
+    f.write(f"Memoria resolución (RSS): {_formatear_mb(memoria['resolucion_rss_mb'])}\n")
+    f.write(f"Memoria generación (tracemalloc): {_formatear_mb(memoria['generacion_mb'])}\n")
+    f.write(f"Memoria resolución (tracemalloc): {_formatear_mb(memoria['resolucion_mb'])}\n")
+    f.write(f"Memoria pico RSS: {_formatear_mb(memoria['rss_pico_mb'])}\n")
+    if "rss_workers_mb" in memoria:
+        f.write(f"Memoria pico RSS por worker: {_formatear_mb(memoria['rss_workers_mb'])}\n")
+
+
+def mostrar_memoria(memoria):
+    """Muestra en consola la memoria medida de una corrida."""
+    print(f"🧠 Memoria: generación={_formatear_mb(memoria['generacion_rss_mb'])}, "
+          f"resolución={_formatear_mb(memoria['resolucion_rss_mb'])} (crecimiento RSS), "
+          f"pico RSS={_formatear_mb(memoria['rss_pico_mb'])}")
+    if memoria['resolucion_mb'] is not None:
+        print(f"   tracemalloc: generación={_formatear_mb(memoria['generacion_mb'])}, "
+              f"resolución={_formatear_mb(memoria['resolucion_mb'])}")
+
+
 def guardar_comparacion(resultado, archivo):
     """
     Guarda el resultado de una comparación entre exacto y heurístico.
@@ -43,6 +83,14 @@ def guardar_comparacion(resultado, archivo):
                 f"Tiempo={resultado['exacto']['tiempo']:.4f}s\n")
         f.write(f"HEURÍSTICO:  Tamaño={resultado['heuristico']['tamaño']}, "
                 f"Tiempo={resultado['heuristico']['tiempo']:.4f}s\n")
+        for clave, nombre in (('exacto', 'EXACTO'), ('heuristico', 'HEURÍSTICO')):
+            memoria = resultado[clave].get('memoria')
+            if memoria:
+                f.write(f"MEMORIA {nombre}: Generación RSS={_formatear_mb(memoria['generacion_rss_mb'])}, "
+                        f"Resolución RSS={_formatear_mb(memoria['resolucion_rss_mb'])}, "
+                        f"Generación={_formatear_mb(memoria['generacion_mb'])}, "
+                        f"Resolución={_formatear_mb(memoria['resolucion_mb'])}, "
+                        f"Pico RSS={_formatear_mb(memoria['rss_pico_mb'])}\n")
         f.write("-" * 70 + "\n")
         f.write(f"¿Alcanzó óptimo?: {'SÍ' if resultado['alcanzó_optimo'] else 'NO'}\n")
         f.write(f"Error relativo: {resultado['error_relativo']:.2f}%\n")
@@ -50,6 +98,129 @@ def guardar_comparacion(resultado, archivo):
         f.write("="*70 + "\n\n")
 
 
+def guardar_benchmark_decision(resultado, archivo):
+    """
+    Guarda la latencia de las consultas de decisión frente a la
+    optimización completa sobre el mismo grafo.
+    
+    Args:
+        resultado: diccionario con los datos del benchmark
+        archivo: ruta del archivo donde guardar
+    """
+    with open(archivo, "a", encoding="utf-8") as f:
+        f.write(f"Caso: {resultado['n']} nodos\n")
+        f.write(f"Probabilidad: {resultado['probabilidad']}\n")
+        f.write(f"Aristas: {resultado['aristas']}\n")
+        f.write(f"Clique máximo (ω): {resultado['omega']}\n")
+        f.write("-" * 70 + "\n")
+        f.write(f"OPTIMIZACIÓN:  Tiempo={resultado['tiempo_exacto']:.4f}s\n")
+        for k, (existe, tiempo) in resultado['individuales'].items():
+            f.write(f"DECISIÓN k={k}: {'SÍ' if existe else 'NO'}, Tiempo={tiempo:.4f}s\n")
+        f.write(f"LOTE:          Tiempo={resultado['tiempo_lote']:.4f}s\n")
+        for clave, nombre in (('memoria_exacto', 'OPTIMIZACIÓN'), ('memoria_individuales', 'DECISIÓN'),
+                              ('memoria_lote', 'LOTE')):
+            memoria = resultado.get(clave)
+            if memoria:
+                f.write(f"MEMORIA {nombre}: Resolución RSS={_formatear_mb(memoria['resolucion_rss_mb'])}, "
+                        f"Resolución={_formatear_mb(memoria['resolucion_mb'])}, "
+                        f"Pico RSS={_formatear_mb(memoria['rss_pico_mb'])}\n")
+        f.write("="*70 + "\n\n")
+
+
+def guardar_perfil_local(grafo_obj, perfil, archivo):
+    """
+    Guarda el perfil local de cliques (mayor clique que contiene a cada vértice).
+    
+    Args:
+        grafo_obj: instancia de la clase Grafo
+        perfil: diccionario {vértice: tamaño del mayor clique que lo contiene}
+        archivo: ruta del archivo donde guardar
+    """
+    distribucion = {}
+    for tamaño in perfil.values():
+        distribucion[tamaño] = distribucion.get(tamaño, 0) + 1
+    
+    with open(archivo, "a", encoding="utf-8") as f:
+        f.write("="*60 + "\n")
+        f.write("Método: PERFIL LOCAL (mayor clique por vértice)\n")
+        f.write(f"Nodos: {grafo_obj.n_nodos}\n")
+        f.write(f"Probabilidad de conexión: {grafo_obj.probabilidad}\n")
+        f.write(f"Aristas: {len(grafo_obj.G.edges)}\n")
+        f.write(f"Vértices calculados: {len(perfil)}\n")
+        f.write(f"Distribución (tamaño: vértices): {dict(sorted(distribucion.items()))}\n")
+        f.write(f"Perfil: {perfil}\n")
+        f.write(f"Tiempo de ejecución: {grafo_obj.tiempo:.4f} segundos\n")
+        _escribir_memoria(f, getattr(grafo_obj, "memoria", None))
+        f.write("="*60 + "\n\n")
+
+
+def nuevo_estado_barrido(duracion_maxima, archivo_salida, limite_memoria_mb=None):
+    """
+    Estado inicial de un barrido de experimentos (PUNTOS 3 y 7).
+    La semilla base hace que cada iteración genere siempre el mismo grafo.
+    """
+    return {
+        "iteracion": 1,
+        "tiempo_transcurrido": 0.0,
+        "duracion_maxima": duracion_maxima,
+        "limite_memoria_mb": limite_memoria_mb,
+        "semilla": random.randrange(2**32),
+        "completados": [],
+        "bytes_resultados": os.path.getsize(archivo_salida) if os.path.exists(archivo_salida) else 0,
+    }
+
+
+def guardar_checkpoint(ruta, estado):
+    """
+    Guarda el estado de un barrido de forma ATÓMICA: se escribe un archivo
+    temporal y se reemplaza el anterior, así una caída nunca deja un
+    checkpoint a medio escribir.
+    
+    Args:
+        ruta: ruta del archivo de checkpoint (JSON)
+        estado: diccionario con el estado del barrido
+    """
+    temporal = ruta + ".tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump(estado, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporal, ruta)
+
+
+def cargar_checkpoint(ruta):
+    """
+    Lee el checkpoint de un barrido.
+    
+    Returns:
+        diccionario con el estado, o None si no existe o está dañado
+    """
+    try:
+        with open(ruta, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except json.JSONDecodeError:
+        print(f"\n⚠️  Checkpoint dañado, se ignora: '{ruta}'")
+        return None
+
+
+def borrar_checkpoint(ruta):
+    """Elimina el checkpoint de un barrido terminado."""
+    if os.path.exists(ruta):
+        os.remove(ruta)
+
+
+def restaurar_resultados(archivo, tamaño):
+    """
+    Recorta el archivo de resultados al tamaño registrado en el checkpoint,
+    descartando una instancia que se escribió pero no llegó a registrarse.
+    """
+    if os.path.exists(archivo) and os.path.getsize(archivo) > tamaño:
+        with open(archivo, "r+b") as f:
+            f.truncate(tamaño)
+
+
 def preguntar_graficar(mensaje, funcion_graficar):
     """
     Pregunta al usuario si desea graficar y ejecuta la función si acepta.
@@ -71,6 +242,7 @@ def graficar_resultados(ruta_archivo):
     """
     Genera un gráfico que relaciona el tamaño de entrada n (eje X)
     con el tiempo de ejecución (eje Y), y comenta la complejidad observada.
+    Si las corridas registraron memoria, agrega un gráfico de memoria vs n.
     
     Args:
         ruta_archivo: ruta al archivo con los resultados a graficar
@@ -117,6 +289,30 @@ def graficar_resultados(ruta_archivo):
     plt.legend()
     plt.grid(True, alpha=0.3)
     plt.tight_layout()
+
+    # Segundo gráfico: memoria vs n (solo corridas que la registraron)
+    memoria = _extraer_memoria(contenido)
+    if memoria["n"]:
+        plt.figure(figsize=(10, 6))
+        plt.plot(memoria["n"], memoria["generacion_rss"], marker='D', linestyle='--',
+                 linewidth=2, markersize=6, color='silver', label='Generación (crecimiento RSS)')
+        plt.plot(memoria["n"], memoria["resolucion_rss"], marker='v', linestyle='-.',
+                 linewidth=2, markersize=7, color='dimgray', label='Resolución (crecimiento RSS)')
+        # tracemalloc solo se registra con CLIQUE_TRACEMALLOC=1
+        if any(v == v for v in memoria["resolucion"]):
+            plt.plot(memoria["n"], memoria["generacion"], marker='s', linestyle='--',
+                     linewidth=2, markersize=7, color='gray', label='Generación (tracemalloc)')
+            plt.plot(memoria["n"], memoria["resolucion"], marker='o', linestyle='-',
+                     linewidth=2, markersize=8, color=color, label='Resolución (tracemalloc)')
+        plt.plot(memoria["n"], memoria["rss"], marker='^', linestyle=':',
+                 linewidth=2, markersize=7, color='black', label='Pico RSS del proceso')
+        plt.title(titulo.replace("vs Tiempo", "vs Memoria"), fontsize=14, fontweight='bold')
+        plt.xlabel("Número de nodos (n)", fontsize=12)
+        plt.ylabel("Memoria (MB)", fontsize=12)
+        plt.legend()
+        plt.grid(True, alpha=0.3)
+        plt.tight_layout()
+
     plt.show()
 
     # Interpretación automática
@@ -146,6 +342,30 @@ def graficar_resultados(ruta_archivo):
     print("="*60 + "\n")
 
 
+def _extraer_memoria(contenido):
+    """
+    Extrae la memoria de cada corrida del archivo de resultados.
+    Las corridas anteriores a la medición de memoria se omiten.
+    """
+    def _valor(patron, bloque):
+        encontrado = re.search(patron, bloque)
+        return float(encontrado.group(1)) if encontrado else float('nan')
+
+    datos = {"n": [], "generacion_rss": [], "resolucion_rss": [], "generacion": [], "resolucion": [],
+             "rss": []}
+    for bloque in contenido.split("Método:")[1:]:
+        nodos = re.search(r"Nodos:\s*(\d+)", bloque)
+        if not nodos or "Memoria pico RSS" not in bloque:
+            continue
+        datos["n"].append(int(nodos.group(1)))
+        datos["generacion_rss"].append(_valor(r"Memoria generación \(RSS\):\s*([\d.]+)", bloque))
+        datos["resolucion_rss"].append(_valor(r"Memoria resolución \(RSS\):\s*([\d.]+)", bloque))
+        datos["generacion"].append(_valor(r"Memoria generación \(tracemalloc\):\s*([\d.]+)", bloque))
+        datos["resolucion"].append(_valor(r"Memoria resolución \(tracemalloc\):\s*([\d.]+)", bloque))
+        datos["rss"].append(_valor(r"Memoria pico RSS:\s*([\d.]+)", bloque))
+    return datos
+
+
 def graficar_comparacion(archivo="comparacion_metodos.txt"):
     """
     Genera gráficos comparativos entre el algoritmo exacto y el heurístico.
@@ -252,6 +472,12 @@ def limpiar_resultados():
         "resultados_heuristico.txt",
         "resultados_exacto_multiple.txt",
         "resultados_heuristico_multiple.txt",
+        "checkpoint_exacto_multiple.json",
+        "checkpoint_heuristico_multiple.json",
+        "resultados_exacto_distribuido.txt",
+        "resultados_heuristico_streaming.txt",
+        "benchmark_decision.txt",
+        "resultados_perfil_local.txt",
         "comparacion_metodos.txt"
     ]
     